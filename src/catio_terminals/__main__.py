@@ -2,6 +2,7 @@
 
 import asyncio
 import sys
+from collections.abc import Callable
 from pathlib import Path
 from typing import Annotated
 
@@ -9,6 +10,9 @@ import typer
 
 from catio_terminals.xml.cache import XmlCache
 
+# Maximum number of YAML files cleaned up concurrently by 'clean-yaml --all'
+MAX_CONCURRENT_CLEANUPS = 8
+
 app = typer.Typer(
     name="catio-terminals",
     help="CATio Terminal Editor - YAML terminal configuration editor",
@@ -112,7 +116,21 @@ def clean_yaml(
     This command loads YAML files, merges with XML data (dropping non-XML symbols),
     selects all symbols, and saves the cleaned file.
     """
-    asyncio.run(_clean_yaml_async(file, all_files, include_all_coe, include_coe))
+    with asyncio.Runner(loop_factory=_event_loop_factory()) as runner:
+        runner.run(_clean_yaml_async(file, all_files, include_all_coe, include_coe))
+
+
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Get the uvloop event loop factory if uvloop is installed.
+
+    Returns:
+        uvloop's event loop factory, or None to use the default asyncio loop
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
 
 
 async def _clean_yaml_async(
@@ -142,10 +160,19 @@ async def _clean_yaml_async(
             print(f"No YAML files found in {terminals_dir}", file=sys.stderr)
             raise typer.Exit(code=1)
 
-        for yaml_path in files_to_process:
-            await _cleanup_single_yaml(
-                yaml_path, beckhoff_client, FileService, include_all_coe, include_coe
-            )
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CLEANUPS)
+
+        async def _cleanup_bounded(yaml_path: Path) -> None:
+            async with semaphore:
+                await _cleanup_single_yaml(
+                    yaml_path,
+                    beckhoff_client,
+                    FileService,
+                    include_all_coe,
+                    include_coe,
+                )
+
+        await asyncio.gather(*(_cleanup_bounded(p) for p in files_to_process))
 
     elif file is not None:
         if not file.exists():
@@ -169,13 +196,15 @@ async def _cleanup_single_yaml(
 ) -> None:
     """Clean up a single YAML file.
 
-    Reloads symbols from XML and marks all as selected.
+    Reloads symbols from XML and marks all as selected. File loading and saving
+    run in worker threads so that several files can be processed concurrently;
+    the report for each file is printed in one block once it has been saved.
     """
-    print(f"Processing: {yaml_path.name}")
+    report = [f"Processing: {yaml_path.name}"]
 
     # Load the YAML file
-    config = file_service.open_file(yaml_path)
-    print(f"  Loaded {len(config.terminal_types)} terminals")
+    config = await asyncio.to_thread(file_service.open_file, yaml_path)
+    report.append(f"  Loaded {len(config.terminal_types)} terminals")
 
     # Merge with XML data (primitive symbols)
     # prefer_xml=True ensures we get fresh data from XML
@@ -212,18 +241,19 @@ async def _cleanup_single_yaml(
                 coe.selected = False
 
         if group_name:
-            print(
+            report.append(
                 f"  {terminal_id}: selected {selected_count} symbols "
                 f"(PDO group: {group_name}), {coe_count} CoE"
             )
         else:
-            print(
+            report.append(
                 f"  {terminal_id}: selected {selected_count} symbols, {coe_count} CoE"
             )
 
     # Save the cleaned file
-    config.to_yaml(yaml_path)
-    print(f"  Saved: {yaml_path.name}")
+    await asyncio.to_thread(config.to_yaml, yaml_path)
+    report.append(f"  Saved: {yaml_path.name}")
+    print("\n".join(report))
 
 
 def main() -> None:
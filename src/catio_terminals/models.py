@@ -1,11 +1,31 @@
 """Data models for terminal description YAML files."""
 
 from pathlib import Path
+from typing import Any
 
 from pydantic import BaseModel, Field, computed_field
 
 from catio_terminals.ads_types import get_type_info
 
+# Buffer size used when writing terminal configuration YAML files
+YAML_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _load_yaml(path: Path) -> Any:
+    """Load a YAML file, using the libyaml C loader when it is available.
+
+    Args:
+        path: Path to YAML file
+
+    Returns:
+        The parsed YAML document
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with path.open() as f:
+        return yaml.load(f, Loader=loader)
+
 
 class Identity(BaseModel):
     """Terminal identity information."""
@@ -228,11 +248,7 @@ class RuntimeSymbolsConfig(BaseModel):
         Returns:
             RuntimeSymbolsConfig instance
         """
-        import yaml
-
-        with path.open() as f:
-            data = yaml.safe_load(f)
-        return cls.model_validate(data)
+        return cls.model_validate(_load_yaml(path))
 
     def get_symbols_for_terminal(
         self, terminal_id: str, group_type: str | None
@@ -363,11 +379,7 @@ class TerminalConfig(BaseModel):
         Returns:
             TerminalConfig instance
         """
-        import yaml
-
-        with path.open() as f:
-            data = yaml.safe_load(f)
-        return cls.model_validate(data)
+        return cls.model_validate(_load_yaml(path))
 
     def to_yaml(self, path: Path) -> None:
         """Save configuration to YAML file.
@@ -438,7 +450,9 @@ class TerminalConfig(BaseModel):
         # offset=2: indent content 2 spaces from the dash
         yaml.indent(mapping=2, sequence=4, offset=2)
 
-        with path.open("w") as f:
+        # ruamel emits straight to the file as it goes, so buffer writes generously
+        # rather than issuing a write call for every few emitted lines
+        with path.open("w", buffering=YAML_WRITE_BUFFER_SIZE) as f:
             # Write header comment
             f.write("# Terminal Configuration\n")
             f.write("# " + "=" * 56 + "\n")
@@ -541,11 +555,7 @@ class CompositeTypesConfig(BaseModel):
         Returns:
             CompositeTypesConfig instance
         """
-        import yaml
-
-        with path.open() as f:
-            data = yaml.safe_load(f)
-        return cls.model_validate(data)
+        return cls.model_validate(_load_yaml(path))
 
     def get_type(self, type_name: str) -> CompositeType | None:
         """Get a composite type by name.
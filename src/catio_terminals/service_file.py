@@ -1,6 +1,8 @@
 """File operations service for terminal configuration files."""
 
 import asyncio
+import hashlib
+import json
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -13,16 +15,40 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Default location of the parsed YAML cache (JSON sidecars keyed by file path)
+YAML_CACHE_DIR = Path.home() / ".cache" / "catio_terminals" / "yaml_cache"
+
+
+def _cache_path(file_path: Path, cache_dir: Path) -> Path:
+    """Get the JSON sidecar path used to cache a parsed YAML file.
+
+    Args:
+        file_path: Path to YAML file
+        cache_dir: Directory holding the cached JSON files
+
+    Returns:
+        Path of the JSON sidecar for this YAML file
+    """
+    key = hashlib.sha1(str(file_path.resolve()).encode()).hexdigest()
+    return cache_dir / f"{file_path.stem}-{key[:16]}.json"
+
 
 class FileService:
     """Service for handling file operations."""
 
     @staticmethod
-    def open_file(file_path: Path) -> TerminalConfig:
+    def open_file(
+        file_path: Path, cache_dir: Path | None = YAML_CACHE_DIR
+    ) -> TerminalConfig:
         """Open and load a terminal configuration file.
 
+        The parsed configuration is cached as JSON in cache_dir, keyed by the
+        YAML file's modification time and size, so that reopening an unchanged
+        file skips the YAML parse.
+
         Args:
             file_path: Path to YAML file
+            cache_dir: Directory for the parsed YAML cache, or None to disable it
 
         Returns:
             TerminalConfig instance
@@ -31,7 +57,36 @@ class FileService:
             Exception: If file cannot be opened or parsed
         """
         logger.info(f"Opening file: {file_path}")
-        return TerminalConfig.from_yaml(file_path)
+        if cache_dir is None:
+            return TerminalConfig.from_yaml(file_path)
+
+        stat = file_path.stat()
+        cache_path = _cache_path(file_path, cache_dir)
+        try:
+            cached = json.loads(cache_path.read_bytes())
+            if cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == (
+                stat.st_size
+            ):
+                logger.debug(f"Using cached parse of {file_path} from {cache_path}")
+                return TerminalConfig.model_validate(cached["config"])
+        except (OSError, ValueError, KeyError):
+            pass
+
+        config = TerminalConfig.from_yaml(file_path)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(
+                json.dumps(
+                    {
+                        "mtime_ns": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                        "config": config.model_dump(mode="json"),
+                    }
+                )
+            )
+        except OSError as e:
+            logger.warning(f"Failed to cache parsed YAML for {file_path}: {e}")
+        return config
 
     @staticmethod
     async def merge_xml_data(
@@ -1,32 +1,17 @@
 """Interface for ``python -m fastcs_catio``."""
 
+import asyncio
 import logging
 import os
-import socket
 from enum import Enum
 from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
-from fastcs.launch import FastCS
-from fastcs.logging import LogLevel as FastCSLogLevel
-from fastcs.logging import configure_logging
-from fastcs.transports.epics.ca.transport import EpicsCATransport
-from fastcs.transports.epics.options import (
-    EpicsDocsOptions,
-    EpicsGUIOptions,
-    EpicsIOCOptions,
-)
-from softioc.imports import callbackSetQueueSize
 
 from fastcs_catio.logging import VERBOSE  # noqa: F401 - registers VERBOSE level
-from fastcs_catio.terminal_config import set_terminal_types_patterns
 
 from . import __version__
-from .catio_controller import (
-    CATioServerController,
-)
-from .client import RemoteRoute
 
 __all__ = ["main"]
 
@@ -34,8 +19,6 @@ CALLBACK_SIZE: int = 50000
 
 app = typer.Typer(no_args_is_help=True)
 
-callbackSetQueueSize(CALLBACK_SIZE)
-
 
 class LogLevel(str, Enum):
     critical = "CRITICAL"
@@ -46,6 +29,21 @@ class LogLevel(str, Enum):
     verbose = "VERBOSE"
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop | None:
+    """
+    Create a uvloop event loop for the IOC if uvloop is installed.
+
+    :returns: a new uvloop event loop, or None to use the default asyncio loop
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    loop = uvloop.new_event_loop()
+    asyncio.set_event_loop(loop)
+    return loop
+
+
 def version_callback(value: bool):
     if value:
         typer.echo(__version__)
@@ -142,23 +140,40 @@ def ioc(
 
     (use '[command] --help' for more details)
     """
+    # The EPICS/FastCS stack is only imported here so that '--version' and '--help'
+    # don't pay its import cost.
+    from fastcs.launch import FastCS
+    from fastcs.logging import LogLevel as FastCSLogLevel
+    from fastcs.logging import configure_logging, intercept_std_logger
+    from fastcs.transports.epics.ca.transport import EpicsCATransport
+    from fastcs.transports.epics.options import (
+        EpicsDocsOptions,
+        EpicsGUIOptions,
+        EpicsIOCOptions,
+    )
+    from softioc.imports import callbackSetQueueSize
+
+    from fastcs_catio.terminal_config import set_terminal_types_patterns
+
+    from .catio_controller import CATioServerController
+    from .client import RemoteRoute
+    from .utils import resolve_host
+
+    callbackSetQueueSize(CALLBACK_SIZE)
+
     # Configure fastcs loguru logger first - map VERBOSE to DEBUG since fastcs doesn't
     # have it. This gives us colored output via loguru.
-    level_name = log_level.upper()
-    fastcs_level_name = "DEBUG" if level_name == "VERBOSE" else level_name
+    level_name = log_level.value
+    fastcs_level_name = "DEBUG" if log_level is LogLevel.verbose else level_name
     fastcs_level = FastCSLogLevel[fastcs_level_name]
     configure_logging(level=fastcs_level)
 
     # Configure standard library logging to forward to loguru for colored output
-    # Handle VERBOSE level which is custom to fastcs-catio
-    level_value = getattr(logging, level_name, None)
-    if level_value is None and level_name == "VERBOSE":
-        level_value = VERBOSE
-    logging.basicConfig(level=level_value, handlers=[])
+    # (the custom VERBOSE level is registered by fastcs_catio.logging); only the
+    # root level needs setting as records are handed over to loguru below.
+    logging.getLogger().setLevel(level_name)
 
     # Intercept our package's logger to forward to loguru
-    from fastcs.logging import intercept_std_logger
-
     intercept_std_logger("fastcs_catio")
 
     logger = logging.getLogger(__name__)
@@ -186,11 +201,7 @@ def ioc(
     )
 
     # Get the Beckhoff TwinCAT server IP address in case the server name was provided
-    ip = (
-        socket.gethostbyname(tcp_server)
-        if not (tcp_server.count(".") == 3)
-        else tcp_server
-    )
+    ip = resolve_host(tcp_server)
 
     # Specify the parameters for the remote route to the Beckhoff TwinCAT server
     route = RemoteRoute(ip)
@@ -201,7 +212,7 @@ def ioc(
     )
 
     # Launch the CATio IOC with FastCS
-    launcher = FastCS(controller, transports=[epics_transport])
+    launcher = FastCS(controller, transports=[epics_transport], loop=_new_event_loop())
     launcher.run()
 
 
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache, cached_property
 from typing import (
     Generic,
     Literal,
@@ -38,29 +39,53 @@ class AdsMessageDataType(Generic[G, S]):
     def __set__(self, instance, value: S): ...
 
     @classmethod
-    def get_dtype(cls, datatype: Self) -> npt.DTypeLike:
+    def get_dtype(
+        cls, datatype: type[AdsMessageDataType] | AdsMessageDataType
+    ) -> npt.DTypeLike:
         """
-        Get the numpy data type from the AdsMessageDataType instance.
+        Get the numpy data type from an AdsMessageDataType alias or instance.
+
+        :param datatype: the AdsMessageDataType alias, e.g. UINT32 or BYTES6
 
         :returns: the numpy data type
 
         :raises TypeError: exception arising when the AdsMessageDataType instance \
             isn't a valid numpy data type
         """
-        np_type = get_args(datatype)[0]
-        if isinstance(np_type, type) and issubclass(np_type, np.generic):
-            # Keep numpy array scalar object types as they are
-            return np_type
-        if get_origin(np_type) == np.ndarray:
-            # Extract type from np.ndarray[tuple[Literal[length]], np.dtype[np_type]]
-            length_tuple, dtype_arg = get_args(np_type)
-            length = get_args(get_args(length_tuple)[0])[0]
-            if get_args(dtype_arg)[0] is np.bytes_:
-                return f"S{length}"
-        raise TypeError(f"AdsMessageDataType with unsupported numpy type: {np_type}")
+        try:
+            return _DTYPE_TABLE[datatype]
+        except KeyError:
+            return _get_dtype(datatype)
 
 
-@dataclass
+@cache
+def _get_dtype(
+    datatype: type[AdsMessageDataType] | AdsMessageDataType,
+) -> npt.DTypeLike:
+    """
+    Get the numpy data type from an AdsMessageDataType alias, memoized per alias.
+
+    :param datatype: the AdsMessageDataType alias, e.g. UINT32 or BYTES6
+
+    :returns: the numpy data type
+
+    :raises TypeError: exception arising when the AdsMessageDataType instance \
+        isn't a valid numpy data type
+    """
+    np_type = get_args(datatype)[0]
+    if isinstance(np_type, type) and issubclass(np_type, np.generic):
+        # Keep numpy array scalar object types as they are
+        return np_type
+    if get_origin(np_type) == np.ndarray:
+        # Extract type from np.ndarray[tuple[Literal[length]], np.dtype[np_type]]
+        length_tuple, dtype_arg = get_args(np_type)
+        length = get_args(get_args(length_tuple)[0])[0]
+        if get_args(dtype_arg)[0] is np.bytes_:
+            return f"S{length}"
+    raise TypeError(f"AdsMessageDataType with unsupported numpy type: {np_type}")
+
+
+@dataclass(frozen=True)
 class AmsNetId:
     """
     AmsNetId class representing the unique AmsNetId identifier of the TwinCAT device on
@@ -91,8 +116,7 @@ class AmsNetId:
         """
         if len(net_id) != 6:
             raise ValueError("AMS NetID must be exactly 6 bytes long.")
-        parts = np.frombuffer(net_id, dtype=np.uint8)
-        return cls(tuple(parts[:4]), tuple(parts[4:]))
+        return cls((net_id[0], net_id[1], net_id[2], net_id[3]), (net_id[4], net_id[5]))
 
     @classmethod
     def from_string(cls, net_id: str) -> Self:
@@ -105,10 +129,13 @@ class AmsNetId:
 
         :raises ValueError: if the netid is not exactly 6 dot-separated octets
         """
-        parts = [int(x) for x in net_id.split(".")]
-        if len(parts) != 6:
-            raise ValueError("AMS NetID must be exactly 6 dot-separated octets.")
-        return cls((parts[0], parts[1], parts[2], parts[3]), (parts[4], parts[5]))
+        try:
+            a, b, c, d, e, f = net_id.split(".")
+        except ValueError as err:
+            raise ValueError(
+                "AMS NetID must be exactly 6 dot-separated octets."
+            ) from err
+        return cls((int(a), int(b), int(c), int(d)), (int(e), int(f)))
 
     def to_bytes(self) -> bytes:
         """
@@ -116,11 +143,17 @@ class AmsNetId:
 
         :returns: the netid expressed as a byte stream
         """
-        return (
-            np.frombuffer(bytes(self.root + self.mask), dtype=np.uint8, count=6)
-            .reshape((6,))
-            .tobytes()
-        )
+        return self._packed
+
+    @cached_property
+    def _packed(self) -> bytes:
+        """The netid as a 6-byte stream, computed once per AmsNetId."""
+        return bytes(self.root + self.mask)
+
+    @cached_property
+    def _dotted(self) -> str:
+        """The netid in the standard dot-notation, computed once per AmsNetId."""
+        return ".".join(map(str, self.root + self.mask))
 
     def to_string(self) -> str:
         """
@@ -128,13 +161,13 @@ class AmsNetId:
 
         :returns: the netid expressed as a string of format x.x.x.x.x.x
         """
-        return ".".join(map(str, self.root + self.mask))
+        return self._dotted
 
     def __repr__(self) -> str:
         return f"AmsNetId(root={self.root}, mask={self.mask})"
 
     def __str__(self) -> str:
-        return ".".join(map(str, self.root + self.mask))
+        return self._dotted
 
 
 @dataclass
@@ -231,3 +264,16 @@ UINT8: TypeAlias = AdsMessageDataType[np.uint8, SupportsInt]
 UINT16: TypeAlias = AdsMessageDataType[np.uint16, SupportsInt]
 UINT32: TypeAlias = AdsMessageDataType[np.uint32, SupportsInt]
 UINT64: TypeAlias = AdsMessageDataType[np.uint64, SupportsInt]
+
+_DTYPE_TABLE: dict[object, npt.DTypeLike] = {
+    BYTES6: "S6",
+    BYTES12: "S12",
+    BYTES16: "S16",
+    INT16: np.int16,
+    INT32: np.int32,
+    UINT8: np.uint8,
+    UINT16: np.uint16,
+    UINT32: np.uint32,
+    UINT64: np.uint64,
+}
+"""Numpy data types of the predefined AdsMessageDataType aliases."""
@@ -1,4 +1,5 @@
-from dataclasses import KW_ONLY, dataclass
+import sys
+from dataclasses import KW_ONLY, dataclass, field
 from typing import Any, TypeVar
 
 import numpy as np
@@ -17,43 +18,77 @@ logger = bind_logger(logger_name=__name__)
 
 AnyT = TypeVar("AnyT", str, int, float)
 
+_MISSING: Any = object()
+"""Sentinel marking an attribute whose value has not been cached yet."""
+
+SMALL_WAVEFORM_NBYTES = 256
+"""Size up to which waveform values are compared as raw bytes."""
+
 
 async def compare_and_update_attribute_value(
-    attr: AttrR[AnyT, AttributeIORef], value: Any, response: Any
-) -> None:
+    attr: AttrR[AnyT, AttributeIORef] | AttrR[np.ndarray, AttributeIORef],
+    value: Any,
+    response: Any,
+    dtype: type | None = None,
+) -> Any:
     """
     Compare the current attribute value with the polled response; update if needed.
 
     :param attr: The attribute to be updated.
     :param value: The current value of the attribute.
     :param response: The polled response from the controller.
+    :param dtype: The attribute data type, if already resolved by the caller.
+
+    :returns: the attribute value after the comparison, to be cached by the caller.
     """
     # Handle numpy arrays (waveforms) separately
     if isinstance(response, np.ndarray):
         assert isinstance(attr.datatype, Waveform)
         assert isinstance(value, np.ndarray)
-        if not np.array_equal(response, value):
+        # Cheap identity/shape/dtype checks first; only scan the data if they match.
+        # Small arrays are compared as raw bytes, avoiding numpy's dispatch overhead.
+        if response is not value and (
+            response.shape != value.shape
+            or response.dtype != value.dtype
+            or (
+                response.tobytes() != value.tobytes()
+                if response.nbytes <= SMALL_WAVEFORM_NBYTES
+                else not np.array_equal(response, value)
+            )
+        ):
             value = response
             await attr.update(value)
-            logger.debug(f"Waveform attribute '{attr.name}' was updated to {response}.")
+            # Only log a digest of the array, its full repr can be very large.
+            logger.debug(
+                "Waveform attribute '{}' was updated (len={}, first={}, last={}).",
+                attr.name,
+                value.size,
+                value.flat[0] if value.size else None,
+                value.flat[-1] if value.size else None,
+            )
         else:
             logger.debug(
-                f"Current value of attribute '{attr.name}' is unchanged: {value}"
+                "Current value of waveform attribute '{}' is unchanged (len={}).",
+                attr.name,
+                value.size,
             )
     # Handle simple data types
     else:
-        new_value = attr.dtype(response)
+        if dtype is None:
+            dtype = attr.dtype
+        new_value = response if type(response) is dtype else dtype(response)
         if new_value != value:
             value = new_value
             await attr.update(value)
-            logger.debug(f"Attribute '{attr.name}' was updated to value {new_value}")
+            logger.debug("Attribute '{}' was updated to value {}", attr.name, value)
         else:
             logger.debug(
-                f"Current value of CoE attribute '{attr.name}' is unchanged: {value}"
+                "Current value of CoE attribute '{}' is unchanged: {}", attr.name, value
             )
+    return value
 
 
-@dataclass
+@dataclass(slots=True)
 class CATioControllerAttributeIORef(AttributeIORef):
     """Reference to a CATio controller attribute IO."""
 
@@ -62,6 +97,12 @@ class CATioControllerAttributeIORef(AttributeIORef):
     _: KW_ONLY  # Additional keyword-only arguments
     update_period: float | None = 0.2
     """Update period for the FastCS attribute"""
+    api_name: str = field(init=False, repr=False, compare=False)
+    """Attribute name as used in CATio API query commands, derived from its name"""
+
+    def __post_init__(self) -> None:
+        self.name = sys.intern(self.name)
+        self.api_name = self.name.replace("_", "").upper()
 
 
 class CATioControllerAttributeIO(AttributeIO[AnyT, CATioControllerAttributeIORef]):
@@ -78,10 +119,14 @@ class CATioControllerAttributeIO(AttributeIO[AnyT, CATioControllerAttributeIORef
         """Client connection to the CATio controller."""
         self.subsystem: str = subsystem
         """Subsystem name for the CATio controller."""
+        self._query_prefix: str = subsystem.upper()
+        """Prefix of the CATio API query commands for this subsystem."""
         self.controller_id: int = controller_id
         """Identifier for the CATio controller."""
         self._value: dict[str, Any] = {}
         """Cached value of the controller attributes."""
+        self._requests: dict[str, tuple[CATioFastCSRequest, type]] = {}
+        """Cached poll requests and data types of the controller attributes."""
 
     # async def send(
     #     self,
@@ -96,35 +141,50 @@ class CATioControllerAttributeIO(AttributeIO[AnyT, CATioControllerAttributeIORef
     async def update(self, attr: AttrR[AnyT, CATioControllerAttributeIORef]) -> None:
         """Poll the attribute value and update it if it has changed."""
 
-        logger.debug(f"Poll handler has been called for {attr.group} -> {attr.name}.")
+        logger.debug(
+            "Poll handler has been called for {} -> {}.", attr.group, attr.name
+        )
 
-        # Process initial startup poll (inc. unique update for invariant attributes)
-        if (attr.io_ref.update_period is ONCE) or (self._value.get(attr.name) is None):
+        # Process initial startup poll (inc. unique update for invariant attributes);
+        # the attribute already holds its initial value, so it is only re-published
+        # if it must be converted to the attribute data type.
+        value = self._value.get(attr.name, _MISSING)
+        if (attr.io_ref.update_period is ONCE) or (value is _MISSING):
+            value = attr.get()
+            assert value is not None
+            dtype = attr.dtype
+            if not isinstance(attr.datatype, Waveform) and type(value) is not dtype:
+                value = dtype(value)
+                await attr.update(value)
+            self._value[attr.name] = value
+
+        if attr.io_ref.update_period is ONCE:
             query = "INITIAL_STARTUP_POLL"
-            self._value[attr.name] = attr.get()
-            assert self._value[attr.name] is not None
-            if isinstance(attr.datatype, Waveform):
-                await attr.update(self._value[attr.name])
-            else:
-                await attr.update(attr.dtype(self._value[attr.name]))
 
-        # Process regular polling attribute updates
+        # Process regular polling attribute updates (from the very first poll)
         else:
             # Send a request to the controller to read the latest attribute value.
-            attr_name = attr.io_ref.name.replace("_", "").upper()
-            query = f"{self.subsystem.upper()}_{attr_name}_ATTR"
-            response = await self._connection.send_query(
-                CATioFastCSRequest(command=query, controller_id=self.controller_id)
-            )
+            cached = self._requests.get(attr.name)
+            if cached is None:
+                cached = self._requests[attr.name] = (
+                    CATioFastCSRequest(
+                        command=f"{self._query_prefix}_{attr.io_ref.api_name}_ATTR",
+                        controller_id=self.controller_id,
+                    ),
+                    attr.dtype,
+                )
+            request, dtype = cached
+            query = request.command
+            response = await self._connection.send_query(request)
 
             # Update the attribute value if it has changed.
             if response is not None:
-                await compare_and_update_attribute_value(
-                    attr, self._value[attr.name], response
+                self._value[attr.name] = await compare_and_update_attribute_value(
+                    attr, value, response, dtype
                 )
             else:
                 logger.debug(
-                    f"No corresponding API method was found for command '{query}'"
+                    "No corresponding API method was found for command '{}'", query
                 )
 
         self.log_event(
@@ -135,7 +195,7 @@ class CATioControllerAttributeIO(AttributeIO[AnyT, CATioControllerAttributeIORef
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CATioControllerSymbolAttributeIORef(AttributeIORef):
     """Reference to a CATio controller attribute IO."""
 
@@ -145,6 +205,9 @@ class CATioControllerSymbolAttributeIORef(AttributeIORef):
     update_period: float | None = None
     """Update period for the FastCS attribute"""
 
+    def __post_init__(self) -> None:
+        self.name = sys.intern(self.name)
+
 
 class CATioControllerSymbolAttributeIO(
     AttributeIO[AnyT, CATioControllerSymbolAttributeIORef]
@@ -171,6 +234,8 @@ class CATioControllerSymbolAttributeIO(
         """Dictionary mapping CATio controller attribute names to ADS symbol names."""
         self._value: dict[str, Any] = {}
         """Cached value of the controller attributes."""
+        self._unmapped_logged: set[str] = set()
+        """Names of the attributes already reported as having no ADS symbol."""
 
     async def send(
         self,
@@ -185,8 +250,10 @@ class CATioControllerSymbolAttributeIO(
         :param value: The value to send.
         """
         logger.debug(
-            f"{self.subsystem}:: Symbol Write handler has been called for "
-            f"{attr.group} -> {attr.name}."
+            "{}:: Symbol Write handler has been called for {} -> {}.",
+            self.subsystem,
+            attr.group,
+            attr.name,
         )
         symbol_name = self.symbol_map.get(attr.name, None)
         if symbol_name is not None:
@@ -207,10 +274,13 @@ class CATioControllerSymbolAttributeIO(
             )
             return
 
-        logger.error(
-            f"Attribute {attr.name} has no ADS symbol correspondance; "
-            f"write operation failed."
-        )
+        if attr.name not in self._unmapped_logged:
+            self._unmapped_logged.add(attr.name)
+            logger.error(
+                "Attribute {} has no ADS symbol correspondance; write operation "
+                "failed (further write failures for it won't be reported).",
+                attr.name,
+            )
 
     async def update(
         self, attr: AttrR[AnyT, CATioControllerSymbolAttributeIORef]
@@ -224,7 +294,7 @@ class CATioControllerSymbolAttributeIO(
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class CATioControllerCoEAttributeIORef(AttributeIORef):
     """Reference to a CATio controller CoE attribute IO."""
 
@@ -241,6 +311,12 @@ class CATioControllerCoEAttributeIORef(AttributeIORef):
     """Data type of the CoE parameter associated with the attribute"""
     update_period: float | None = ONCE
     """Update period for the FastCS attribute"""
+    is_string: bool = field(init=False, repr=False, compare=False)
+    """Whether the CoE parameter is a byte string, derived from its data type"""
+
+    def __post_init__(self) -> None:
+        self.name = sys.intern(self.name)
+        self.is_string = self.dtype.kind == "S"
 
 
 class CATioControllerCoEAttributeIO(
@@ -262,6 +338,8 @@ class CATioControllerCoEAttributeIO(
         """Subsystem name for the CATio controller."""
         self._value: dict[str, Any] = {}
         """Cached value of the controller attributes."""
+        self._requests: dict[str, tuple[CATioFastCSRequest, type]] = {}
+        """Cached read requests and data types of the CoE attributes."""
 
     async def send(
         self,
@@ -276,8 +354,10 @@ class CATioControllerCoEAttributeIO(
         :param value: The value to send.
         """
         logger.debug(
-            f"{self.subsystem}:: CoE Write handler has been called for "
-            f"{attr.group} -> {attr.name}."
+            "{}:: CoE Write handler has been called for {} -> {}.",
+            self.subsystem,
+            attr.group,
+            attr.name,
         )
 
         await self._connection.send_command(
@@ -313,9 +393,16 @@ class CATioControllerCoEAttributeIO(
         try:
             if isinstance(response, np.ndarray):
                 assert isinstance(attr.datatype, Waveform)
-                self._value[attr.name] = response
+                # Cast once to the declared waveform layout so that later polls
+                # and publishes don't need to copy or convert the cached array.
+                self._value[attr.name] = np.ascontiguousarray(
+                    response, dtype=attr.datatype.array_dtype
+                )
             else:
-                self._value[attr.name] = attr.dtype(response)
+                dtype = attr.dtype
+                self._value[attr.name] = (
+                    response if type(response) is dtype else dtype(response)
+                )
         except Exception as e:
             logger.warning(
                 f"Error converting response for attribute '{attr.name}': {e}"
@@ -323,8 +410,10 @@ class CATioControllerCoEAttributeIO(
             self._value[attr.name] = response
         await attr.update(self._value[attr.name])
         logger.debug(
-            f"CoE attribute '{attr.name}' of type {attr.datatype} was initialised "
-            f"to value {response}."
+            "CoE attribute '{}' of type {} was initialised to value {}.",
+            attr.name,
+            attr.datatype,
+            response,
         )
 
     async def update(self, attr: AttrR[AnyT, CATioControllerCoEAttributeIORef]) -> None:
@@ -334,41 +423,51 @@ class CATioControllerCoEAttributeIO(
         :param attr: The attribute to be updated.
         """
         logger.debug(
-            f"{self.subsystem}:: CoE Read handler has been called for "
-            f"{attr.group} -> {attr.name}."
+            "{}:: CoE Read handler has been called for {} -> {}.",
+            self.subsystem,
+            attr.group,
+            attr.name,
         )
 
         # Get the current value of the CoE attribute
-        response = await self._connection.send_query(
-            CATioFastCSRequest(
-                command=self.query,
-                address=attr.io_ref.address,
-                index=attr.io_ref.index,
-                subindex=attr.io_ref.subindex,
-                dtype=attr.io_ref.dtype,
+        cached = self._requests.get(attr.name)
+        if cached is None:
+            cached = self._requests[attr.name] = (
+                CATioFastCSRequest(
+                    command=self.query,
+                    address=attr.io_ref.address,
+                    index=attr.io_ref.index,
+                    subindex=attr.io_ref.subindex,
+                    dtype=attr.io_ref.dtype,
+                ),
+                attr.dtype,
             )
-        )
+        request, dtype = cached
+        response = await self._connection.send_query(request)
         # Convert byte responses to string if required
-        if attr.io_ref.dtype.kind == "S" and isinstance(response, bytes):
+        if attr.io_ref.is_string and isinstance(response, bytes):
             response = response.decode("utf-8")
 
-        logger.debug(f"Initial value of CoE parameter {attr.io_ref.name}: {response}")
+        logger.debug(
+            "Initial value of CoE parameter {}: {}", attr.io_ref.name, response
+        )
 
         if response is not None:
-            if self._value.get(attr.name) is None:
+            value = self._value.get(attr.name, _MISSING)
+            if value is _MISSING:
                 # Initialise the attribute value at the start of the IOC.
                 logger.debug(
-                    f"CoE Attribute '{attr.name}' hasn't been initialised yet."
+                    "CoE Attribute '{}' hasn't been initialised yet.", attr.name
                 )
                 await self.initialise_attribute_value(attr, response)
 
             else:
                 # Update the attribute value if it has changed.
                 logger.debug(
-                    f"Checking if value of CoE Attribute '{attr.name}' needs updating."
+                    "Checking if value of CoE Attribute '{}' needs updating.", attr.name
                 )
-                await compare_and_update_attribute_value(
-                    attr, self._value[attr.name], response
+                self._value[attr.name] = await compare_and_update_attribute_value(
+                    attr, value, response, dtype
                 )
 
         self.log_event(
@@ -1,10 +1,12 @@
 import asyncio
+import logging
 import time
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from logging import getLogger
-from typing import Any, Self, SupportsInt
+from typing import Any, Self
 
+import numpy as np
 import numpy.typing as npt
 from fastcs.tracer import Tracer
 
@@ -14,31 +16,68 @@ from .client import AsyncioADSClient
 
 logger = getLogger(__name__)
 
+MAX_CONCURRENT_REQUESTS = 16
+"""Maximum number of requests in flight at once on a single CATio stream."""
 
+
+def _frozen(value: Any) -> Any:
+    """
+    Convert a request argument into a hashable form with the same equality.
+
+    :param value: the request argument, e.g. a scalar, a list or a numpy array
+
+    :returns: the argument itself if it is a scalar, else a hashable equivalent
+    """
+    if isinstance(value, np.ndarray):
+        return (value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, list | tuple):
+        return tuple(_frozen(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _frozen(v)) for k, v in value.items()))
+    return value
+
+
+@dataclass(slots=True, frozen=True, eq=False, init=False, repr=False)
 class CATioFastCSRequest:
     """
     Request object sent to the catio client (string subclass).
     Used to encapsulate all the information needed to perform a query.
+    Requests are immutable and hashable so that they can be built once and reused.
+    Array, list and dict arguments are compared and hashed by value; any other \
+        unhashable argument type makes the request unhashable.
     """
 
+    command: str
+    """The command to be executed by the CATio client."""
+    args: tuple[Any, ...]
+    """Optional positional arguments for the command."""
+    kwargs: dict[str, Any]
+    """Optional keyword arguments for the command."""
+
     def __init__(self, command: str, *args, **kwargs):
-        self.command = command
-        """The command to be executed by the CATio client."""
-        self.args = args
-        """Optional positional arguments for the command."""
-        self.kwargs = kwargs
-        """Optional keyword arguments for the command."""
+        object.__setattr__(self, "command", command)
+        object.__setattr__(self, "args", args)
+        object.__setattr__(self, "kwargs", kwargs)
+
+    def _key(self) -> tuple[Any, ...]:
+        """Get the hashable form of the request used for equality and hashing."""
+        return (self.command, _frozen(self.args), _frozen(self.kwargs))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CATioFastCSRequest):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
 
     def __repr__(self) -> str:
         """Return a string representation of the CATio request."""
-        return repr(
-            self.command
-            + "("
-            + ", ".join(self.args)
-            + ", "
-            + ", ".join([f"{k}={v!r}" for k, v in self.kwargs.items()])
-            + ")"
-        )
+        params = [
+            *map(repr, self.args),
+            *(f"{k}={v!r}" for k, v in self.kwargs.items()),
+        ]
+        return f"{self.command}({', '.join(params)})"
 
 
 @dataclass
@@ -70,7 +109,18 @@ class DisconnectedError(Exception):
     pass
 
 
-@dataclass
+async def _disconnected(*args, **kwargs) -> Any:
+    """
+    Stand-in for the stream connection methods while no connection is established.
+
+    :raises DisconnectedError: always, as no connection is established
+    """
+    raise DisconnectedError(
+        "No open connection with the CATio system. Call connect() first."
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class CATioServerConnectionSettings:
     """
     Settings required to establish a TCP connection with a CATio server.
@@ -89,7 +139,7 @@ class CATioServerConnectionSettings:
             at address {self.ip}, on port {self.ams_port}"
 
 
-@dataclass
+@dataclass(slots=True)
 class CATioStreamConnection:
     """
     For setting up a CATio client able to read and write to a stream.
@@ -103,12 +153,14 @@ class CATioStreamConnection:
     """The connection settings used to connect to the CATio server."""
     _catio_client: AsyncioADSClient
     """The ADS client used to communicate with the CATio server."""
-    _notification_symbols: dict[SupportsInt, Sequence[AdsSymbol]] = field(
-        default_factory=dict
-    )
+    _notification_symbols: dict[int, Sequence[AdsSymbol]] = field(default_factory=dict)
     """A mapping of device ids to their corresponding notification symbols."""
     _subscribed_symbols: list[AdsSymbol] = field(default_factory=list)
     """The list of currently subscribed notification symbols."""
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False)
+    """The semaphore bounding the number of requests in flight on the client."""
+    _lock: asyncio.Lock = field(init=False, repr=False)
+    """The lock ensuring exclusive access when changing the connection state."""
 
     @property
     def settings(self) -> CATioServerConnectionSettings:
@@ -121,7 +173,7 @@ class CATioStreamConnection:
         return self._catio_client
 
     @property
-    def notification_symbols(self) -> dict[SupportsInt, Sequence[AdsSymbol]]:
+    def notification_symbols(self) -> dict[int, Sequence[AdsSymbol]]:
         """A mapping of device ids to their corresponding notification symbols."""
         return self._notification_symbols
 
@@ -149,23 +201,26 @@ class CATioStreamConnection:
 
     def __post_init__(self) -> None:
         """
-        Initialise the asyncio lock for managing concurrent access to the client.
+        Initialise the asyncio primitives managing concurrent access to the client.
+        ADS responses are matched to their requests by invoke id, so queries and
+        commands only take one of a bounded number of request slots; the lock is
+        reserved for operations changing the connection state (e.g. closing it).
         """
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
         self._lock = asyncio.Lock()
 
     async def __aenter__(self) -> Self:
         """
-        Acquire the asyncio lock to ensure exclusive access to the client.
+        Acquire the asyncio lock to ensure exclusive access to the connection state.
         """
         await self._lock.acquire()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """
-        Release the asyncio lock to allow other coroutines to access the client.
+        Release the asyncio lock to allow other coroutines to change the connection.
         """
         self._lock.release()
-        # pass
 
     async def initialise(self) -> None:
         """
@@ -175,10 +230,10 @@ class CATioStreamConnection:
 
         If the server configuration changes, this method should be called again.
         """
-        await self.client.introspect_io_server()
-        all_symbols = await self.client.get_all_symbols()
+        await self._catio_client.introspect_io_server()
+        all_symbols = await self._catio_client.get_all_symbols()
         for device_id, symbols_dict in all_symbols.items():
-            self._notification_symbols[device_id] = list(symbols_dict.values())
+            self._notification_symbols[int(device_id)] = list(symbols_dict.values())
 
     async def command(self, command: str, *args, **kwargs) -> None:
         """
@@ -190,9 +245,10 @@ class CATioStreamConnection:
         :param kwargs: keyword arguments for the command
         """
         try:
-            await self.client.command(command, *args, **kwargs)
+            async with self._semaphore:
+                await self._catio_client.command(command, *args, **kwargs)
         except ValueError as err:
-            logger.error(f"API command failed: {err}")
+            logger.error("API command failed: %s", err)
 
     async def query(self, message: CATioFastCSRequest) -> CATioFastCSResponse:
         """
@@ -201,18 +257,20 @@ class CATioStreamConnection:
 
         :param message: a CATio request message which will be routed via the client.
 
-        :returns: the response to the query as received by the CATio client
+        :returns: the response to the query as received by the CATio client, \
+            with a None value if no API method is available for the query
         """
-        response = ""
         try:
-            response = await self.client.query(
-                message.command, *message.args, **message.kwargs
-            )
+            async with self._semaphore:
+                response = await self._catio_client.query(
+                    message.command, *message.args, **message.kwargs
+                )
         except ValueError as err:
-            logger.debug(f"API call failed with error: {err}")
+            logger.debug("API call failed with error: %s", err)
+            response = None
 
         # # Very verbose logging!
-        # logger.debug(f"CATio client response to '{message}' query: {response}")
+        # logger.debug("CATio client response to '%s' query: %s", message, response)
         return CATioFastCSResponse(response)
 
     async def add_notifications(self, device_id: int) -> None:
@@ -224,24 +282,32 @@ class CATioStreamConnection:
 
         :raises ValueError: if no notification symbols are found for the device
         """
-        if device_id not in self.notification_symbols:
+        subscription_symbols = self._notification_symbols.get(int(device_id))
+        if subscription_symbols is None:
             raise ValueError(
                 f"No notification symbols found for device id {device_id}."
             )
-        subscription_symbols = self.notification_symbols[device_id]
-        self._subscribed_symbols = list(subscription_symbols)
+        # The symbol lists built by initialise() are never mutated, so share them.
+        self._subscribed_symbols = (
+            subscription_symbols
+            if isinstance(subscription_symbols, list)
+            else list(subscription_symbols)
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Subscribing to symbols: %s", [s.name for s in subscription_symbols]
+            )
 
-        await self.client.add_notifications(
+        await self._catio_client.add_notifications(
             subscription_symbols,
             max_delay_ms=10,
             cycle_time_ms=10,
         )
         logger.info(
-            f"Subscribed to {len(subscription_symbols)} symbols "
-            + f"for device id {device_id}."
+            "Subscribed to %d symbols for device id %s.",
+            len(subscription_symbols),
+            device_id,
         )
-        # Small delay to avoid overloading the server after the subscription process.
-        await asyncio.sleep(0.3)
 
     def monitor_notifications(self, enabled: bool, flush_period: float = 0.5) -> None:
         """
@@ -253,9 +319,9 @@ class CATioStreamConnection:
         :param flush_period: the period (in seconds) at which notifications are flushed
         """
         if enabled:
-            self.client.start_notification_monitor(flush_period)
+            self._catio_client.start_notification_monitor(flush_period)
         else:
-            self.client.stop_notification_monitor()
+            self._catio_client.stop_notification_monitor()
 
     async def get_notifications(self, timeout: int = 60) -> npt.NDArray:
         """
@@ -266,7 +332,7 @@ class CATioStreamConnection:
 
         :returns: a numpy array containing the latest notifications
         """
-        return await self.client.get_notifications(timeout)
+        return await self._catio_client.get_notifications(timeout)
 
     async def delete_all_notifications(self) -> None:
         """
@@ -276,18 +342,24 @@ class CATioStreamConnection:
         :param device_id: the id of the EtherCAT device to subscribe to
         """
         logger.info("...deleting active notifications...")
-        await self.client.delete_notifications(self._subscribed_symbols)
+        await self._catio_client.delete_notifications(self._subscribed_symbols)
 
     async def close(self) -> None:
         """
         Stop any background tasks related to notification monitoring, \
             unsubscribe to all symbol notifications \
                 and close the client connection with the catio server.
+        All request slots are taken first, so that the requests already in flight \
+            receive their response before the client stops listening for them.
         """
-        await self.delete_all_notifications()
-        await asyncio.sleep(1)
-
-        await self.client.close()
+        for _ in range(MAX_CONCURRENT_REQUESTS):
+            await self._semaphore.acquire()
+        try:
+            await self.delete_all_notifications()
+            await self._catio_client.close()
+        finally:
+            for _ in range(MAX_CONCURRENT_REQUESTS):
+                self._semaphore.release()
 
 
 class CATioConnection(Tracer):
@@ -302,6 +374,22 @@ class CATioConnection(Tracer):
         super().__init__()
         self.__connection: CATioStreamConnection | None = connection
         """The underlying CATio stream connection."""
+        self._bind_connection(connection)
+
+    def _bind_connection(self, connection: CATioStreamConnection | None) -> None:
+        """
+        Cache the bound methods of the stream connection used on the polling path,
+        so that each call avoids the connection property lookup.
+
+        :param connection: the stream connection to bind to, or None if disconnected
+        """
+        if connection is None:
+            self._command = self._query = _disconnected
+            self._get_notifications = _disconnected
+        else:
+            self._command = connection.command
+            self._query = connection.query
+            self._get_notifications = connection.get_notifications
 
     @property
     def _connection(self) -> CATioStreamConnection:
@@ -324,6 +412,7 @@ class CATioConnection(Tracer):
         :param value: the new connection to set, or None to disconnect
         """
         self.__connection = value
+        self._bind_connection(value)
 
     @property
     def settings(self) -> CATioServerConnectionSettings:
@@ -369,8 +458,7 @@ class CATioConnection(Tracer):
 
         :param message: a CATio request message which will be routed via the client
         """
-        async with self._connection as connection:
-            await connection.command(message.command, *message.args, **message.kwargs)
+        await self._command(message.command, *message.args, **message.kwargs)
 
     async def send_query(self, message: CATioFastCSRequest) -> Any:
         """
@@ -381,14 +469,13 @@ class CATioConnection(Tracer):
 
         :returns: the response to the query as received by the CATio client
         """
-        async with self._connection as connection:
-            response = await connection.query(message)
-            self.log_event(
-                "Received query response",
-                query=message.command,
-                response=response.to_string(),
-            )
-            return response.value
+        response = await self._query(message)
+        self.log_event(
+            "Received query response",
+            query=message.command,
+            response=response.to_string(),
+        )
+        return response.value
 
     async def close(self) -> None:
         """
@@ -409,7 +496,8 @@ class CATioConnection(Tracer):
 
         :param device_id: the id of the device whose notifications must be setup
         """
-        await self._connection.add_notifications(device_id)
+        async with self._connection as connection:
+            await connection.add_notifications(device_id)
 
     async def get_notification_streams(self, timeout: int = 60) -> npt.NDArray:
         """
@@ -420,7 +508,7 @@ class CATioConnection(Tracer):
 
         :returns: a numpy array containing the latest notifications
         """
-        return await self._connection.get_notifications(timeout)
+        return await self._get_notifications(timeout)
 
     def enable_notification_monitoring(
         self, enabled: bool, flush_period: float = 0.5
@@ -1,11 +1,11 @@
-import inspect
+import asyncio
 import re
 import string
 import time
 from abc import abstractmethod
-from collections.abc import Generator, Iterator
-from itertools import chain, count
-from types import FrameType
+from collections.abc import Iterator, Sequence
+from functools import lru_cache
+from itertools import count
 from typing import Any
 
 import numpy as np
@@ -46,6 +46,53 @@ from .catio_connection import (
 NOTIFICATION_UPDATE_PERIOD: float = 0.2
 STANDARD_POLL_UPDATE_PERIOD: float = 1.0
 
+_TIMESTAMP_FIELD_RE = re.compile(r"^_([\w ]+(\([\w ]*\))*)+\.timestamp\d*")
+"""Pattern matching the timestamp fields of a notification stream"""
+_TRAILING_ID_RE = re.compile(r"(\d+)$")
+"""Pattern matching the numerical id at the end of an EtherCAT device name"""
+
+_DEVICE_FRAMECOUNTERS_QUERY = "DEVICE_FRAMECOUNTERS_ATTR"
+"""CATio client API query polling the frame counters of an EtherCAT device"""
+_TERMINAL_STATES_QUERY = "TERMINAL_STATES_ATTR"
+"""CATio client API query polling the states of an EtherCAT terminal"""
+_TERMINAL_CRCERRORCOUNTERS_QUERY = "TERMINAL_CRCERRORCOUNTERS_ATTR"
+"""CATio client API query polling the CRC error counters of an EtherCAT terminal"""
+_FRAME_COUNTER_NAMES = (
+    "SystemTime",
+    "SentCyclicFrames",
+    "LostCyclicFrames",
+    "SentAcyclicFrames",
+    "LostAcyclicFrames",
+)
+"""Names of the EtherCAT device frame counter attributes, in API response order"""
+_TERMINAL_STATE_NAMES = ("StateMachine", "LinkStatus")
+"""Names of the EtherCAT terminal state attributes, in API response order"""
+_CRC_ERROR_COUNTER_NAMES = (
+    "CrcErrorPortA",
+    "CrcErrorPortB",
+    "CrcErrorPortC",
+    "CrcErrorPortD",
+)
+"""Names of the EtherCAT terminal CRC error attributes, in API response order"""
+
+
+@lru_cache(maxsize=64)
+def _classify_notification_fields(
+    names: tuple[str, ...],
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Sort the fields of a notification stream by role.
+    The stream layout is fixed once the notifications are set up, so only a few \
+        distinct sets of changed fields are seen and the result is cached.
+
+    :param names: the field names of the notification structured array
+
+    :returns: the timestamp field names and the value field names
+    """
+    timestamps = tuple(filter(_TIMESTAMP_FIELD_RE.match, names))
+    values = tuple(name for name in names if "value" in name)
+    return timestamps, values
+
 
 tracer = Tracer(name=__name__)
 logger = get_logger(__name__)
@@ -93,6 +140,8 @@ class CATioController(Controller, Tracer):
             str, str
         ] = {}  # key is FastCS attribute name, value is complex ads symbol name
         """Map of FastCS attribute names to ADS symbol names."""
+        self._array_snapshots: dict[str, tuple[list[AttrR], npt.NDArray]] = {}
+        """Polled sub-attributes and their last known values, keyed by API query."""
 
         logger.verbose(
             f"CATio controller '{self.ecat_name}' instantiated with PV suffix "
@@ -243,33 +292,33 @@ class CATioController(Controller, Tracer):
                 )
                 self.add_sub_controller(subctrl.name, subctrl)
 
-    def attribute_dict_generator(
-        self,
-    ) -> Generator[dict[str, Attribute], Any, Any]:
+    def collect_attribute_refs(self, attribute_refs: dict[str, Attribute]) -> None:
         """
-        Recursively extract all attribute references from the controller \
-            and its subcontrollers.
+        Extract all attribute references from the controller and its subcontrollers.
+        The controller tree is walked depth-first with an explicit stack, \
+            adding each attribute to the given map in place.
 
-        :yields: a dictionary with the (sub)controller's full attribute name as key \
-            and the attribute object as value.
+        :param attribute_refs: the map to add the attributes to, with the \
+            (sub)controller's full attribute name as key and the attribute object \
+                as value.
         """
-        attr_dict = {}
-        # Extract the current controller's attributes and prefix them with the ecat name
-        for key, attr in self.attributes.items():
-            if isinstance(self, CATioController):
-                ads_name = self.ads_name_map.get(key, None)
-                key = ads_name if ads_name is not None else key
-            attr_dict[".".join([f"_{self.ecat_name}", key])] = attr
-        logger.verbose(
-            f"Extracted {len(attr_dict)} attributes for controller {self.name}."
-        )
-        yield attr_dict
+        stack: list[CATioController] = [self]
+        while stack:
+            ctrl = stack.pop()
+            # Add the controller's attributes, prefixed with its ecat name
+            prefix = f"_{ctrl.ecat_name}."
+            ads_name = ctrl.ads_name_map.get
+            for key, attr in ctrl.attributes.items():
+                attribute_refs[prefix + ads_name(key, key)] = attr
+            logger.verbose(
+                f"Extracted {len(ctrl.attributes)} attributes for controller "
+                f"{ctrl.name}."
+            )
 
-        # Recursively extract the current controller's subcontrollers' attributes
-        if self.sub_controllers:
-            for subctrl in self.sub_controllers.values():
+            # Visit the subcontrollers next, in their registration order
+            for subctrl in reversed(ctrl.sub_controllers.values()):
                 assert isinstance(subctrl, CATioController)
-                yield from subctrl.attribute_dict_generator()
+                stack.append(subctrl)
 
     async def connect(self) -> None:
         """Establish the FastCS connection to the controller and its subcontrollers."""
@@ -288,14 +337,25 @@ class CATioController(Controller, Tracer):
 
         :returns: the response received from the CATio client.
         """
-        query = f"{self.group.upper()}_{function_name.upper()}_ATTR"
+        return await self.send_api_query(
+            f"{self.group.upper()}_{function_name.upper()}_ATTR"
+        )
+
+    async def send_api_query(self, query: str) -> Any:
+        """
+        Send an attribute-related query to the CATio client API.
+
+        :param query: the full CATio API query, e.g. 'TERMINAL_STATES_ATTR'.
+
+        :returns: the response received from the CATio client.
+        """
         try:
             response = await self.connection.send_query(
                 CATioFastCSRequest(command=query, controller_id=self._identifier)
             )
             if response is None:
                 logger.verbose(
-                    f"No corresponding API method was found for command '{query}'"
+                    "No corresponding API method was found for command '%s'", query
                 )
             return response
         except (KeyError, ValueError) as err:
@@ -305,47 +365,49 @@ class CATioController(Controller, Tracer):
             return None
 
     async def update_nparray_subattributes(
-        self, attr_names: list[str], caller: FrameType, dtype: npt.DTypeLike
+        self, attr_names: Sequence[str], query: str, dtype: npt.DTypeLike
     ) -> None:
         """
         Update the sub-attributes of a numpy array attribute by querying \
             the associated CATio client API function.
 
         :param attr_names: a list of attribute names to update.
-        :param caller: the frame of the calling function.
+        :param query: the CATio API query returning the attribute values.
         :param dtype: the expected numpy data type of the attribute values.
         """
-        # Get the associated attributes
-        attr_dict = {k: self.attributes[k] for k in attr_names if k in self.attributes}
-
-        # Get the current attribute value
-        results = []
-        for attr in list(attr_dict.values()):
-            assert isinstance(attr, AttrR)
-            results.append(attr.get())
-        value = np.array(results, dtype=dtype)
+        # Get the associated attributes and their last known values
+        snapshot = self._array_snapshots.get(query)
+        if snapshot is None:
+            attrs: list[AttrR] = []
+            for name in attr_names:
+                attr = self.attributes.get(name)
+                if attr is not None:
+                    assert isinstance(attr, AttrR)
+                    attrs.append(attr)
+            value = np.array([attr.get() for attr in attrs], dtype=dtype)
+            snapshot = self._array_snapshots[query] = (attrs, value)
+        attrs, value = snapshot
 
-        # Get the name of the associated CATio API function and call it
-        fn_name = caller.f_code.co_name
-        response = await self.query_api(fn_name.replace("_", ""))
+        # Call the associated CATio API function
+        response = await self.send_api_query(query)
 
         if response is not None:
             # Check that the received response has the expected type and format
             assert check_ndarray(response, dtype, value.shape), (
-                f"{fn_name.upper()}: unexpected response type {type(response)}"
+                f"{query}: unexpected response type {type(response)}"
             )
 
-            # Determine if the attribute value has changed, and update accordingly
-            if not np.array_equal(response, value):
-                for name, new_value in zip(
-                    attr_names, np.nditer(response), strict=True
-                ):
-                    attr = self.attributes[name]
-                    assert isinstance(attr, AttrR)
-                    await attr.update(new_value)
+            # Only update the attributes whose value has changed
+            changed = np.flatnonzero(response != value)
+            if changed.size:
+                new_values = response.tolist()
+                await asyncio.gather(
+                    *(attrs[i].update(new_values[i]) for i in changed.tolist())
+                )
+                np.copyto(value, response)
 
                 logger.verbose(
-                    f"{fn_name} attributes for device {self.name} have been updated."
+                    "%s attributes for device %s have been updated.", query, self.name
                 )
 
 
@@ -382,6 +444,10 @@ class CATioServerController(CATioController):
             str, Attribute
         ] = {}  # key is attribute name, value is attribute object
         """Map of all attributes available to the CATio server controller."""
+        self._notification_targets: dict[str, Attribute | None] = {}
+        """Cache of the attribute updated by each notification value field."""
+        self._timestamp_attributes: dict[str, AttrR] = {}
+        """Cache of the timestamp attribute updated by each notification stream."""
         self.notification_enabled = False
         """Flag indicating if notification monitoring is enabled."""
         self.notification_stream: npt.NDArray | None = None
@@ -529,6 +595,8 @@ class CATioServerController(CATioController):
         Recursively register all subcontrollers available from a system node \
             with their parent controller.
         To do so, the EtherCAT system is traversed from top to bottom, left to right.
+        Sibling nodes are processed concurrently, so that their queries to the \
+            CATio client are pipelined over the connection.
         Once registered, each subcontroller is then initialised
         (attributes are created).
 
@@ -538,13 +606,16 @@ class CATioServerController(CATioController):
         """
         subcontrollers: list[CATioController] = []
         if node.has_children():
-            for child in node.children:
-                ctlr = await self.get_subcontrollers_from_node(child)
+            for ctlr in await asyncio.gather(
+                *(self.get_subcontrollers_from_node(child) for child in node.children)
+            ):
                 assert (ctlr is not None) and (isinstance(ctlr, CATioController))
                 subcontrollers.append(ctlr)
 
             logger.verbose(
-                f"{len(subcontrollers)} subcontrollers were found for {node.data.name}."
+                "%d subcontrollers were found for %s.",
+                len(subcontrollers),
+                node.data.name,
             )
 
         return await self._get_subcontroller_object(node, subcontrollers)
@@ -581,7 +652,7 @@ class CATioServerController(CATioController):
                     else node.data.name
                 )
                 logger.verbose(
-                    f"Implementing I/O device '{key}' as CATioSubController."
+                    "Implementing I/O device '%s' as CATioSubController.", key
                 )
                 ctlr = SUPPORTED_CONTROLLERS[key](
                     name=node.data.get_type_name(),
@@ -593,8 +664,8 @@ class CATioServerController(CATioController):
             case IONodeType.Coupler | IONodeType.Slave:
                 assert isinstance(node.data, IOSlave)
                 logger.verbose(
-                    f"Implementing I/O terminal '{node.data.name}' as "
-                    f"CATioSubController."
+                    "Implementing I/O terminal '%s' as CATioSubController.",
+                    node.data.name,
                 )
                 # First check explicit controllers, then fall back to dynamic factory
                 if node.data.type in SUPPORTED_CONTROLLERS:
@@ -626,10 +697,10 @@ class CATioServerController(CATioController):
         }
         for subctrl in self.sub_controllers.values():
             assert isinstance(subctrl, CATioController)
-            gen_obj = subctrl.attribute_dict_generator()
-            for value in gen_obj:
-                attribute_refs.update(value)
+            subctrl.collect_attribute_refs(attribute_refs)
         self.attribute_map = attribute_refs
+        self._notification_targets.clear()
+        self._timestamp_attributes.clear()
         logger.verbose(
             "Full map of attributes available to the CATio server controller: "
             + f"{self.attribute_map.keys()}"
@@ -661,29 +732,49 @@ class CATioServerController(CATioController):
         assert notifications.dtype.names
 
         # Extract the timestamps from the notification changes
-        pattern = re.compile(r"^_([\w ]+(\([\w ]*\))*)+\.timestamp\d*")
-        matches = [s for s in notifications.dtype.names if pattern.search(s)]
-        timestamps = list(
-            chain.from_iterable([notifications[name].tolist() for name in matches])
-        )
+        matches, _ = _classify_notification_fields(notifications.dtype.names)
+        timestamps = rfn.structured_to_unstructured(notifications[list(matches)])
         # Confirm that, if many notif streams, all timestamps have the same value
-        assert all(x == timestamps[0] for x in timestamps), (
+        assert (timestamps == timestamps.flat[0]).all(), (
             "Notification timestamps are not identical for the multiple streams."
         )
 
         # Update the timestamp attribute for the device associated with the notification
-        timestamp_attr_name = matches[0].rstrip(string.digits)
-        timestamp_attr = self.attribute_map[timestamp_attr_name]
+        timestamp_attr = self._timestamp_attributes.get(matches[0])
+        if timestamp_attr is None:
+            attr = self.attribute_map[matches[0].rstrip(string.digits)]
+            assert isinstance(attr, AttrR)
+            timestamp_attr = self._timestamp_attributes[matches[0]] = attr
         timestamp_value = timestamp_attr.datatype.validate(
-            filetime_to_dt(timestamps[0])
+            filetime_to_dt(int(timestamps.flat[0]))
         )
-        assert isinstance(timestamp_attr, AttrR)
         await timestamp_attr.update(timestamp_value)
         # logger.verbose(
         #     f"Updated notification attribute {timestamp_attr_name} "
         #     + f"to value {timestamp_value}"
         # )
 
+    def _get_notification_target(self, field_name: str) -> Attribute | None:
+        """
+        Get the attribute updated by a notification value field.
+        The field name is resolved against the attribute map once, then cached.
+
+        :param field_name: the name of the notification value field.
+
+        :returns: the associated attribute, or None if it isn't in the attribute map.
+        """
+        try:
+            return self._notification_targets[field_name]
+        except KeyError:
+            pass
+        # Remove the '.value' from the notification name
+        attr_name = field_name.rsplit(".", 1)[0]
+        target = self.attribute_map.get(attr_name)
+        if target is None:
+            logger.warning(f"No reference to {attr_name} in the CATio attribute map")
+        self._notification_targets[field_name] = target
+        return target
+
     @scan(NOTIFICATION_UPDATE_PERIOD)
     async def notifications(self):
         """
@@ -735,8 +826,9 @@ class CATioServerController(CATioController):
                     )
                 else:
                     logger.debug(
-                        f"Notification fields which show changes: "
-                        f"{diff.dtype.names}, {diff}"
+                        "Notification fields which show changes: %s, %s",
+                        diff.dtype.names,
+                        diff,
                     )
 
                 # Update the previous notif stream value to the latest one received
@@ -746,25 +838,23 @@ class CATioServerController(CATioController):
                 await self.update_notification_timestamp(diff)
 
                 # Filter out any non-value fields from the notification changes
-                non_value_names = [
-                    name for name in diff.dtype.names if "value" not in name
-                ]
+                _, value_names = _classify_notification_fields(diff.dtype.names)
                 if is_first_notification:
                     logger.info(
-                        f"FIRST NOTIFICATION: {len(non_value_names)} non-value fields, "
-                        f"{len(diff.dtype.names) - len(non_value_names)} value fields"
+                        f"FIRST NOTIFICATION: "
+                        f"{len(diff.dtype.names) - len(value_names)} non-value fields, "
+                        f"{len(value_names)} value fields"
                     )
-                if len(non_value_names) == len(diff.dtype.names):
+                if not value_names:
                     if is_first_notification:
                         logger.error(
                             "FIRST NOTIFICATION: Early return - no value fields found!"
                         )
                     return
 
-                # Remove the notif fields that have changed which aren't relevant
-                filtered_diff = rfn.drop_fields(
-                    diff, drop_names=non_value_names, usemask=False, asrecarray=True
-                )
+                # Keep a view of the notif value fields only (multi-field indexing
+                # doesn't copy the data, unlike dropping the other fields)
+                filtered_diff = diff[list(value_names)]
                 if is_first_notification:
                     assert filtered_diff.dtype.names
                     logger.debug(
@@ -774,24 +864,19 @@ class CATioServerController(CATioController):
                     )
                 else:
                     logger.verbose(
-                        f"Value field notifications which have changed: "
-                        f"{filtered_diff} {filtered_diff.size}, {filtered_diff.shape}"
+                        "Value field notifications which have changed: %s %s, %s",
+                        filtered_diff,
+                        filtered_diff.size,
+                        filtered_diff.shape,
                     )
 
                 assert filtered_diff.dtype.names
                 updates_count = 0
                 for name in filtered_diff.dtype.names:
-                    # Remove the '.value' from the notification name
-                    attr_name = name.rsplit(".", 1)[0]
-
-                    if attr_name not in self.attribute_map.keys():
-                        logger.warning(
-                            f"No reference to {attr_name} in the CATio attribute map"
-                        )
+                    notif_attribute = self._get_notification_target(name)
+                    if notif_attribute is None:
                         continue
 
-                    notif_attribute = self.attribute_map[attr_name]
-
                     # Extract the new value from the notification field
                     if isinstance(filtered_diff[name], np.ndarray):
                         # Handle the oversampling arrays (must be 1D numpy arrays)
@@ -822,8 +907,9 @@ class CATioServerController(CATioController):
                     await notif_attribute.update(new_value)
                     updates_count += 1
                     logger.verbose(
-                        f"Updated notification attribute {attr_name} "
-                        f"to value {new_value}."
+                        "Updated notification attribute for %s to value %s.",
+                        name,
+                        new_value,
                     )
 
                 if is_first_notification:
@@ -997,7 +1083,9 @@ class CATioDeviceController(CATioController):
                     "slaves_states", update_period=STANDARD_POLL_UPDATE_PERIOD
                 ),
                 group=self.attr_group_name,
-                initial_value=np.array(self.io.slaves_states, dtype=np.uint8).flatten(),
+                initial_value=np.ascontiguousarray(
+                    self.io.slaves_states, dtype=np.uint8
+                ).ravel(),
                 description="I/O device, states of slave terminals",
             ),
         )
@@ -1011,9 +1099,9 @@ class CATioDeviceController(CATioController):
                     "slaves_crc_counters", update_period=STANDARD_POLL_UPDATE_PERIOD
                 ),
                 group=self.attr_group_name,
-                initial_value=np.array(
+                initial_value=np.ascontiguousarray(
                     self.io.slaves_crc_counters, dtype=np.uint32
-                ).flatten(),
+                ).ravel(),
                 description="I/O device, slave crc error sum counters",
             ),
         )
@@ -1051,7 +1139,7 @@ class CATioDeviceController(CATioController):
         """
         Extract the id value from the EtherCAT device name (e.g. from ETH5 or EBUS12).
         """
-        matches = re.search(r"(\d+)$", self.name)
+        matches = _TRAILING_ID_RE.search(self.name)
         if matches:
             return int(matches.group(0))
         raise NameError(
@@ -1081,16 +1169,9 @@ class CATioDeviceController(CATioController):
     @scan(STANDARD_POLL_UPDATE_PERIOD)
     async def frame_counters(self) -> None:
         """Periodically poll the EtherCAT frame counters from the device."""
-        attr_names = [
-            "SystemTime",
-            "SentCyclicFrames",
-            "LostCyclicFrames",
-            "SentAcyclicFrames",
-            "LostAcyclicFrames",
-        ]
-        frame = inspect.currentframe()
-        assert frame is not None, "Function name couldn't be retrieved."
-        await self.update_nparray_subattributes(attr_names, frame, np.uint32)
+        await self.update_nparray_subattributes(
+            _FRAME_COUNTER_NAMES, _DEVICE_FRAMECOUNTERS_QUERY, np.uint32
+        )
 
 
 class CATioTerminalController(CATioController):
@@ -1282,25 +1363,15 @@ class CATioTerminalController(CATioController):
         """
         Periodically poll the EtherCAT terminal states from the io.
         """
-        attr_names = [
-            "StateMachine",
-            "LinkStatus",
-        ]
-        frame = inspect.currentframe()
-        assert frame is not None, "Function name couldn't be retrieved."
-        await self.update_nparray_subattributes(attr_names, frame, np.uint8)
+        await self.update_nparray_subattributes(
+            _TERMINAL_STATE_NAMES, _TERMINAL_STATES_QUERY, np.uint8
+        )
 
     @scan(STANDARD_POLL_UPDATE_PERIOD)
     async def crc_error_counters(self) -> None:
         """
         Periodically poll the EtherCAT terminal CRC error counters from the io.
         """
-        attr_names = [
-            "CrcErrorPortA",
-            "CrcErrorPortB",
-            "CrcErrorPortC",
-            "CrcErrorPortD",
-        ]
-        frame = inspect.currentframe()
-        assert frame is not None, "Function name couldn't be retrieved."
-        await self.update_nparray_subattributes(attr_names, frame, np.uint32)
+        await self.update_nparray_subattributes(
+            _CRC_ERROR_COUNTER_NAMES, _TERMINAL_CRCERRORCOUNTERS_QUERY, np.uint32
+        )
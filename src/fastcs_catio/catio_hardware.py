@@ -23,6 +23,28 @@ from fastcs_catio.devices import ELM_OVERSAMPLING_FACTOR, OVERSAMPLING_FACTOR
 tracer = Tracer(name=__name__)
 logger = bind_logger(logger_name=__name__)
 
+_INT_DATATYPE = Int()
+"""Integer datatype shared by all attributes, FastCS datatypes being immutable"""
+
+
+def _int_attr(group: str, description: str, initial_value: int = 0) -> AttrR:
+    """
+    Create a read-only integer attribute which is updated by ADS notifications.
+
+    :param group: the attribute group name of the controller.
+    :param description: the attribute description.
+    :param initial_value: the attribute value before the first notification.
+
+    :returns: the new integer attribute.
+    """
+    return AttrR(
+        datatype=_INT_DATATYPE,
+        io_ref=None,
+        group=group,
+        initial_value=initial_value,
+        description=description,
+    )
+
 
 class EtherCATMasterController(CATioDeviceController):
     """A sub-controller for an EtherCAT Master I/O device."""
@@ -53,84 +75,38 @@ class EtherCATMasterController(CATioDeviceController):
         # Get the attributes specific to this type of device
         self.add_attribute(
             "InputsSlaveCount",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Number of slaves reached in last cycle",
-            ),
+            _int_attr(self.attr_group_name, "Number of slaves reached in last cycle"),
         )
         self.add_attribute(
             "InputsDevState",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="EtherCAT device input cycle frame status",
-            ),
+            _int_attr(self.attr_group_name, "EtherCAT device input cycle frame status"),
         )
         self.add_attribute(
             "OutputsDevCtrl",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="EtherCAT device output control value",
-            ),
+            _int_attr(self.attr_group_name, "EtherCAT device output control value"),
         )
         for i in range(0, self.num_ads_streams):
             self.add_attribute(
                 f"InFrm{i}State",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description="Cyclic Ethernet input frame status",
-                ),
+                _int_attr(self.attr_group_name, "Cyclic Ethernet input frame status"),
             )
             self.add_attribute(
                 f"InFrm{i}WcState",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description="Inputs accumulated working counter",
-                ),
+                _int_attr(self.attr_group_name, "Inputs accumulated working counter"),
             )
             self.add_attribute(
                 f"InFrm{i}InpToggle",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description="EtherCAT cyclic frame update indicator",
+                _int_attr(
+                    self.attr_group_name, "EtherCAT cyclic frame update indicator"
                 ),
             )
             self.add_attribute(
                 f"OutFrm{i}Ctrl",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description="EtherCAT output frame control value",
-                ),
+                _int_attr(self.attr_group_name, "EtherCAT output frame control value"),
             )
             self.add_attribute(
                 f"OutFrm{i}WcCtrl",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description="Outputs accumulated working counter",
-                ),
+                _int_attr(self.attr_group_name, "Outputs accumulated working counter"),
             )
 
             # Map the FastCS channel attribute name to the symbol name used by ADS
@@ -183,12 +159,10 @@ class EK1101Controller(CATioTerminalController):
         # Get the attributes specific to this type of terminal
         self.add_attribute(
             "ID",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
+            _int_attr(
+                self.attr_group_name,
+                "Unique ID for the group of components",
                 initial_value=1,
-                description="Unique ID for the group of components",
             ),
         )
 
@@ -236,35 +210,17 @@ class EL1004Controller(CATioTerminalController):
         # Get the attributes specific to this type of terminal
         self.add_attribute(
             "WcState",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Slave working counter state value",
-            ),
+            _int_attr(self.attr_group_name, "Slave working counter state value"),
         )
         self.add_attribute(
             "InputToggle",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Availability of an updated digital value",
-            ),
+            _int_attr(self.attr_group_name, "Availability of an updated digital value"),
         )
 
         for i in range(1, self.num_channels + 1):
             self.add_attribute(
                 f"DICh{i}Value",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description=f"Channel#{i} digital input value",
-                ),
+                _int_attr(self.attr_group_name, f"Channel#{i} digital input value"),
             )
             # Map the FastCS attribute name to the symbol name used by ADS
             self.ads_name_map[f"DICh{i}Value"] = f"Channel{i}"
@@ -292,35 +248,17 @@ class EL1014Controller(CATioTerminalController):
         # Get the attributes specific to this type of terminal
         self.add_attribute(
             "WcState",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Slave working counter state value",
-            ),
+            _int_attr(self.attr_group_name, "Slave working counter state value"),
         )
         self.add_attribute(
             "InputToggle",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Availability of an updated digital value",
-            ),
+            _int_attr(self.attr_group_name, "Availability of an updated digital value"),
         )
 
         for i in range(1, self.num_channels + 1):
             self.add_attribute(
                 f"DICh{i}Value",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description=f"Channel#{i} digital input value",
-                ),
+                _int_attr(self.attr_group_name, f"Channel#{i} digital input value"),
             )
             # Map the FastCS attribute name to the symbol name used by ADS
             self.ads_name_map[f"DICh{i}Value"] = f"Channel{i}"
@@ -348,35 +286,17 @@ class EL1124Controller(CATioTerminalController):
         # Get the attributes specific to this type of terminal
         self.add_attribute(
             "WcState",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Slave working counter state value",
-            ),
+            _int_attr(self.attr_group_name, "Slave working counter state value"),
         )
         self.add_attribute(
             "InputToggle",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Availability of an updated digital value",
-            ),
+            _int_attr(self.attr_group_name, "Availability of an updated digital value"),
         )
 
         for i in range(1, self.num_channels + 1):
             self.add_attribute(
                 f"DICh{i}Value",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description=f"Channel#{i} digital input value",
-                ),
+                _int_attr(self.attr_group_name, f"Channel#{i} digital input value"),
             )
             # Map the FastCS attribute name to the symbol name used by ADS
             self.ads_name_map[f"DICh{i}Value"] = f"Channel{i}"
@@ -404,35 +324,17 @@ class EL1084Controller(CATioTerminalController):
         # Get the attributes specific to this type of terminal
         self.add_attribute(
             "WcState",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Slave working counter state value",
-            ),
+            _int_attr(self.attr_group_name, "Slave working counter state value"),
         )
         self.add_attribute(
             "InputToggle",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Availability of an updated digital value",
-            ),
+            _int_attr(self.attr_group_name, "Availability of an updated digital value"),
         )
 
         for i in range(1, self.num_channels + 1):
             self.add_attribute(
                 f"DICh{i}Value",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description=f"Channel#{i} digital input value",
-                ),
+                _int_attr(self.attr_group_name, f"Channel#{i} digital input value"),
             )
             # Map the FastCS attribute name to the symbol name used by ADS
             self.ads_name_map[f"DICh{i}Value"] = f"Channel{i}"
@@ -460,63 +362,27 @@ class EL1502Controller(CATioTerminalController):
         # Get the attributes specific to this type of terminal
         self.add_attribute(
             "WcState",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Slave working counter state value",
-            ),
+            _int_attr(self.attr_group_name, "Slave working counter state value"),
         )
         self.add_attribute(
             "InputToggle",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Availability of an updated digital value",
-            ),
+            _int_attr(self.attr_group_name, "Availability of an updated digital value"),
         )
         self.add_attribute(
             "CNTInputStatus",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Input channel counter status",
-            ),
+            _int_attr(self.attr_group_name, "Input channel counter status"),
         )
         self.add_attribute(
             "CNTInputValue",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Input channel counter value",
-            ),
+            _int_attr(self.attr_group_name, "Input channel counter value"),
         )
         self.add_attribute(
             "CNTOutputStatus",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Output channel counter status",
-            ),
+            _int_attr(self.attr_group_name, "Output channel counter status"),
         )
         self.add_attribute(
             "CNTOutputValue",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Output channel counter set value",
-            ),
+            _int_attr(self.attr_group_name, "Output channel counter set value"),
         )
         # Map the FastCS attribute names to the symbol names used by ADS
         self.ads_name_map["CNTInputStatus"] = "CNTInputs.Countervalue"
@@ -547,25 +413,13 @@ class EL2024Controller(CATioTerminalController):
         # Get the attributes specific to this type of terminal
         self.add_attribute(
             "WcState",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Slave working counter state value",
-            ),
+            _int_attr(self.attr_group_name, "Slave working counter state value"),
         )
 
         for i in range(1, self.num_channels + 1):
             self.add_attribute(
                 f"DOCh{i}Value",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description=f"Channel#{i} digital output value",
-                ),
+                _int_attr(self.attr_group_name, f"Channel#{i} digital output value"),
             )
             # Map the FastCS attribute name to the symbol name used by ADS
             self.ads_name_map[f"DOCh{i}Value"] = f"Channel{i}"
@@ -593,25 +447,13 @@ class EL2024v0010Controller(CATioTerminalController):
         # Get the attributes specific to this type of terminal
         self.add_attribute(
             "WcState",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Slave working counter state value",
-            ),
+            _int_attr(self.attr_group_name, "Slave working counter state value"),
         )
 
         for i in range(1, self.num_channels + 1):
             self.add_attribute(
                 f"DOCh{i}Value",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description=f"Channel#{i} digital output value",
-                ),
+                _int_attr(self.attr_group_name, f"Channel#{i} digital output value"),
             )
             # Map the FastCS attribute name to the symbol name used by ADS
             self.ads_name_map[f"DOCh{i}Value"] = f"Channel{i}"
@@ -639,25 +481,13 @@ class EL2124Controller(CATioTerminalController):
         # Get the attributes specific to this type of terminal
         self.add_attribute(
             "WcState",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Slave working counter state value",
-            ),
+            _int_attr(self.attr_group_name, "Slave working counter state value"),
         )
 
         for i in range(1, self.num_channels + 1):
             self.add_attribute(
                 f"DOCh{i}Value",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description=f"Channel#{i} digital output value",
-                ),
+                _int_attr(self.attr_group_name, f"Channel#{i} digital output value"),
             )
             # Map the FastCS attribute name to the symbol name used by ADS
             self.ads_name_map[f"DOCh{i}Value"] = f"Channel{i}"
@@ -691,45 +521,21 @@ class EL3104Controller(CATioTerminalController):
         # Get the attributes specific to this type of terminal
         self.add_attribute(
             "WcState",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Slave working counter state value",
-            ),
+            _int_attr(self.attr_group_name, "Slave working counter state value"),
         )
         self.add_attribute(
             "InputToggle",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Availability of an updated analog value",
-            ),
+            _int_attr(self.attr_group_name, "Availability of an updated analog value"),
         )
 
         for i in range(1, self.num_channels + 1):
             self.add_attribute(
                 f"AICh{i}Status",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description=f"Channel#{i} voltage status",
-                ),
+                _int_attr(self.attr_group_name, f"Channel#{i} voltage status"),
             )
             self.add_attribute(
                 f"AICh{i}Value",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description=f"Channel#{i} analog input value",
-                ),
+                _int_attr(self.attr_group_name, f"Channel#{i} analog input value"),
             )
             # Map the FastCS attribute names to the symbol names used by ADS
             self.ads_name_map[f"AICh{i}Status"] = f"AIStandardChannel{i}.Status"
@@ -758,45 +564,21 @@ class EL3602Controller(CATioTerminalController):
         # Get the attributes specific to this type of terminal
         self.add_attribute(
             "WcState",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Slave working counter state value",
-            ),
+            _int_attr(self.attr_group_name, "Slave working counter state value"),
         )
         self.add_attribute(
             "InputToggle",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Availability of an updated analog value",
-            ),
+            _int_attr(self.attr_group_name, "Availability of an updated analog value"),
         )
 
         for i in range(1, self.num_channels + 1):
             self.add_attribute(
                 f"AICh{i}Status",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description=f"Channel#{i} voltage status",
-                ),
+                _int_attr(self.attr_group_name, f"Channel#{i} voltage status"),
             )
             self.add_attribute(
                 f"AICh{i}Value",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description=f"Channel#{i} analog input value",
-                ),
+                _int_attr(self.attr_group_name, f"Channel#{i} analog input value"),
             )
             # Map the FastCS attribute names to the symbol names used by ADS
             self.ads_name_map[f"AICh{i}Status"] = f"AIInputsChannel{i}"
@@ -830,23 +612,15 @@ class EL3702Controller(CATioTerminalController):
         for i in range(1, self.operating_channels + 1):
             self.add_attribute(
                 f"AICh{i}CycleCount",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description=f"Record transfer counter for channel#{i}",
+                _int_attr(
+                    self.attr_group_name, f"Record transfer counter for channel#{i}"
                 ),
             )
             if self.oversampling_factor == 1:
                 self.add_attribute(
                     f"AICh{i}ValueOvsmpl",
-                    AttrR(
-                        datatype=Int(),
-                        io_ref=None,
-                        group=self.attr_group_name,
-                        initial_value=0,
-                        description=f"Analog sample value(s) for channel#{i}",
+                    _int_attr(
+                        self.attr_group_name, f"Analog sample value(s) for channel#{i}"
                     ),
                 )
             else:
@@ -891,24 +665,12 @@ class EL4134Controller(CATioTerminalController):
         # Get the attributes specific to this type of terminal
         self.add_attribute(
             "WcState",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Slave working counter state value",
-            ),
+            _int_attr(self.attr_group_name, "Slave working counter state value"),
         )
         for i in range(1, self.num_channels + 1):
             self.add_attribute(
                 f"AOCh{i}Value",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description=f"Channel#{i} analog output value",
-                ),
+                _int_attr(self.attr_group_name, f"Channel#{i} analog output value"),
             )
             # Map the FastCS attribute name to the symbol name used by ADS
             self.ads_name_map[f"AOCh{i}Value"] = f"AOOutputChannel{i}.Analogoutput"
@@ -934,43 +696,19 @@ class EL9410Controller(CATioTerminalController):
         # Get the attributes specific to this type of terminal
         self.add_attribute(
             "WcState",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Slave working counter state value",
-            ),
+            _int_attr(self.attr_group_name, "Slave working counter state value"),
         )
         self.add_attribute(
             "InputToggle",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Counter for valid telegram received",
-            ),
+            _int_attr(self.attr_group_name, "Counter for valid telegram received"),
         )
         self.add_attribute(
             "StatusUp",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Power contacts voltage diagnostic status",
-            ),
+            _int_attr(self.attr_group_name, "Power contacts voltage diagnostic status"),
         )
         self.add_attribute(
             "StatusUs",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="E-bus supply voltage diagnostic status",
-            ),
+            _int_attr(self.attr_group_name, "E-bus supply voltage diagnostic status"),
         )
 
         attr_count = len(self.attributes) - initial_attr_count
@@ -994,33 +732,15 @@ class EL9505Controller(CATioTerminalController):
         # Get the attributes specific to this type of terminal
         self.add_attribute(
             "WcState",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Slave working counter state value",
-            ),
+            _int_attr(self.attr_group_name, "Slave working counter state value"),
         )
         self.add_attribute(
             "InputToggle",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Counter for valid telegram received",
-            ),
+            _int_attr(self.attr_group_name, "Counter for valid telegram received"),
         )
         self.add_attribute(
             "StatusUo",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Output voltage status",
-            ),
+            _int_attr(self.attr_group_name, "Output voltage status"),
         )
 
         attr_count = len(self.attributes) - initial_attr_count
@@ -1044,33 +764,15 @@ class EL9512Controller(CATioTerminalController):
         # Get the attributes specific to this type of terminal
         self.add_attribute(
             "WcState",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Slave working counter state value",
-            ),
+            _int_attr(self.attr_group_name, "Slave working counter state value"),
         )
         self.add_attribute(
             "InputToggle",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Counter for valid telegram received",
-            ),
+            _int_attr(self.attr_group_name, "Counter for valid telegram received"),
         )
         self.add_attribute(
             "StatusUo",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Output voltage status",
-            ),
+            _int_attr(self.attr_group_name, "Output voltage status"),
         )
 
         attr_count = len(self.attributes) - initial_attr_count
@@ -1099,23 +801,13 @@ class ELM3704v0000Controller(CATioTerminalController):
 
         self.add_attribute(
             "WcState",
-            AttrR(
-                datatype=Int(),
-                io_ref=None,
-                group=self.attr_group_name,
-                initial_value=0,
-                description="Slave working counter state value",
-            ),
+            _int_attr(self.attr_group_name, "Slave working counter state value"),
         )
         for i in range(1, self.num_channels + 1):
             self.add_attribute(
                 f"AICh{i}Status",
-                AttrR(
-                    datatype=Int(),
-                    io_ref=None,
-                    group=self.attr_group_name,
-                    initial_value=0,
-                    description=f"Channel#{i} Process Analog Input status",
+                _int_attr(
+                    self.attr_group_name, f"Channel#{i} Process Analog Input status"
                 ),
             )
             self.add_attribute(
@@ -1131,12 +823,8 @@ class ELM3704v0000Controller(CATioTerminalController):
             if self.oversampling_factor == 1:
                 self.add_attribute(
                     f"AICh{i}ValueOvsmpl",
-                    AttrR(
-                        datatype=Int(),
-                        io_ref=None,
-                        group=self.attr_group_name,
-                        initial_value=0,
-                        description=f"ELM3704 terminal channel#{i} value",
+                    _int_attr(
+                        self.attr_group_name, f"ELM3704 terminal channel#{i} value"
                     ),
                 )
             else:
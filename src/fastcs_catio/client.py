@@ -548,7 +548,10 @@ class AsyncioADSClient:
         ams_port = kwargs.get("port", self.__target_ams_port)
         assert isinstance(ams_netid, AmsNetId) and isinstance(ams_port, int)
 
+        # Keep a local copy of the invoke id: other messages may be sent concurrently
+        # while this one is being drained to the stream.
         self.__current_invoke_id += 1
+        invoke_id = self.__current_invoke_id
         payload = message.to_bytes()
         ams_header = AmsHeader(
             target_net_id=ams_netid.to_bytes(),
@@ -559,23 +562,26 @@ class AsyncioADSClient:
             state_flags=StateFlag.AMSCMDSF_ADSCMD,
             length=len(payload),
             error_code=ErrorCode.ERR_NOERROR,
-            invoke_id=np.uint32(self.__current_invoke_id),
+            invoke_id=np.uint32(invoke_id),
         )
         header_raw = ams_header.to_bytes()
         total_length = len(header_raw) + len(payload)
         length_bytes = total_length.to_bytes(4, byteorder="little", signed=False)
 
+        # Register the response event before sending so that a quick response
+        # can't arrive ahead of it.
+        response_ev = ResponseEvent()
+        self.__response_events[invoke_id] = response_ev
+
         logger.debug(
             f"Sending AMS packet: len:{total_length}, cmd:{command}, "
-            f"invoke_id:{self.__current_invoke_id}, target:{ams_netid}:{ams_port}"
+            f"invoke_id:{invoke_id}, target:{ams_netid}:{ams_port}"
         )
         self.__writer.write(b"\x00\x00" + length_bytes + header_raw + payload)
 
         await self.__writer.drain()
         logger.debug(f"Sent AMS packet len:{total_length}.")
 
-        response_ev = ResponseEvent()
-        self.__response_events[self.__current_invoke_id] = response_ev
         return response_ev
 
     async def _recv_ams_message(
@@ -686,7 +692,7 @@ class AsyncioADSClient:
                     )
                     cls = RESPONSE_CLASS[CommandId(header.command_id)]
                     response = cls.from_bytes(body)
-                    self.__response_events[header.invoke_id].set(response)
+                    self.__response_events.pop(header.invoke_id).set(response)
 
             except AssertionError as err:
                 logger.error(err)
@@ -1867,10 +1873,9 @@ class AsyncioADSClient:
                 f"{device.name}: slave CRC sum counters have changed and been updated."
             )
 
-            for crc, slave in list(
-                zip(device.slaves_crc_counters, device.slaves, strict=True)
-            ):
-                slave.crc_error_sum = crc
+        # Always refresh the slave sums, they gate the per-terminal CRC port reads.
+        for crc, slave in zip(device.slaves_crc_counters, device.slaves, strict=True):
+            slave.crc_error_sum = crc
 
     async def poll_crc_counters(self) -> None:
         """
@@ -2780,10 +2785,11 @@ class AsyncioADSClient:
                         )
                         assert streams_dtype.fields
                         logger.debug(
-                            f"Notification stream added to the queue: "
-                            f"qsize={self.__notification_queue.qsize()}, "
-                            f"streams_nb={self.__num_notif_streams}, "
-                            f"notifs_fields={len(streams_dtype.fields)}"
+                            "Notification stream added to the queue: "
+                            "qsize=%d, streams_nb=%d, notifs_fields=%d",
+                            self.__notification_queue.qsize(),
+                            self.__num_notif_streams,
+                            len(streams_dtype.fields),
                         )
 
             except AssertionError as err:
@@ -2825,6 +2831,9 @@ class AsyncioADSClient:
     async def get_notifications(self, timeout: int) -> npt.NDArray:
         """
         Get the notification array available on the notification queue.
+        If several arrays have accumulated on the queue, e.g. when the consumer \
+            lags behind the flushing period, they are all drained and returned \
+                as a single array.
         (Temporary) A timeout is in place to exit the method if no notification data \
             has been added to the queue for a given period.
 
@@ -2837,11 +2846,17 @@ class AsyncioADSClient:
             async with asyncio.timeout(timeout):
                 notifs = await self.__notification_queue.get()
                 self.__notification_queue.task_done()
+                if not self.__notification_queue.empty():
+                    backlog = [notifs]
+                    while not self.__notification_queue.empty():
+                        backlog.append(self.__notification_queue.get_nowait())
+                        self.__notification_queue.task_done()
+                    notifs = np.concatenate(backlog)
                 num_header_fields = 4 * self.__num_notif_streams
                 logger.debug(
-                    f"Got {len(notifs)} notifications with "
-                    + f"{(len(notifs.dtype.fields) - num_header_fields) // 3} "
-                    + "I/O terminal values."
+                    "Got %d notifications with %d I/O terminal values.",
+                    len(notifs),
+                    (len(notifs.dtype.names or ()) - num_header_fields) // 3,
                 )
                 return notifs
         except TimeoutError as err:
@@ -3234,6 +3249,9 @@ class AsyncioADSClient:
     ) -> npt.NDArray[np.uint32]:
         """
         Get the CRC error counters across all ports for a given slave terminal.
+        The port counters are only read from the terminal when their sum differs \
+            from the slave CRC sum counter polled for the whole EtherCAT device; \
+                otherwise the cached values are returned without any ADS round-trip.
 
         :param controller_id: the unique identifier of the fastCS terminal controller
 
@@ -3247,12 +3265,13 @@ class AsyncioADSClient:
             terminal = self.fastcs_io_map.get(controller_id, None)
             if terminal is not None:
                 assert isinstance(terminal, IOSlave)
-                crcs = await self.get_slave_crc_error_counters(
-                    terminal.parent_device, terminal.address
-                )
-                return np.array(
-                    [crcs.port_a_crc, crcs.port_b_crc, crcs.port_c_crc, crcs.port_d_crc]
-                )
+                crcs = np.array(terminal.crcs)
+                if int(crcs.sum(dtype=np.uint64)) != int(terminal.crc_error_sum):
+                    terminal.crcs = await self.get_slave_crc_error_counters(
+                        terminal.parent_device, terminal.address
+                    )
+                    crcs = np.array(terminal.crcs)
+                return crcs
             else:
                 raise KeyError(
                     "No EtherCAT terminal registered against "
@@ -1,19 +1,35 @@
 from __future__ import annotations
 
 import inspect
+import ipaddress
+import json
 import re
 import socket
+import time
 from collections.abc import Callable, Iterable
+from functools import lru_cache
 from logging import getLogger
+from pathlib import Path
 from typing import Any
 
 import numpy as np
 import numpy.typing as npt
+from numpy.lib import recfunctions as rfn
 
 from ._constants import TWINCAT_STRING_ENCODING
 
 logger = getLogger(__name__)
 
+DNS_CACHE_FILE = Path.home() / ".cache" / "fastcs_catio" / "dns.json"
+"""Default location of the on-disk cache of resolved server host names."""
+DNS_CACHE_TTL: float = 24 * 3600
+"""Time in seconds for which a successful host name resolution is reused."""
+DNS_FAILURE_TTL: float = 60
+"""Time in seconds for which a failed host name resolution is reused."""
+
+_ECAT_NAME_PREFIX_RE = re.compile(r"(\w+\s+)\d+")
+"""Pattern matching the leading 'name number' part of an EtherCAT name."""
+
 
 def get_localhost_name() -> str:
     """
@@ -33,6 +49,69 @@ def get_localhost_ip() -> str:
     return socket.gethostbyname(get_localhost_name())
 
 
+def resolve_host(host: str, cache_file: Path | None = DNS_CACHE_FILE) -> str:
+    """
+    Get the IP address of a server given its host name or IP address.
+
+    Resolutions are cached on disk so that restarting an IOC doesn't wait on DNS
+    again; failures are also cached (briefly) to fail fast on repeated attempts.
+    A malformed cache file or entry is ignored and the host resolved again.
+    Note that a cached address is reused for DNS_CACHE_TTL even if connecting to it
+    fails, e.g. after the server has moved; delete the cache file to force a lookup.
+
+    :param host: the server host name or IPv4 address
+    :param cache_file: the json file caching past resolutions, or None to disable it
+
+    :returns: the server IPv4 address
+
+    :raises socket.gaierror: if the host name cannot be resolved
+    """
+    try:
+        return str(ipaddress.IPv4Address(host))
+    except ValueError:
+        pass
+
+    entries: dict[str, dict[str, Any]] = {}
+    if cache_file is not None:
+        try:
+            entries = json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            pass
+        if not isinstance(entries, dict):
+            entries = {}
+
+    now = time.time()
+    entry = entries.get(host)
+    if isinstance(entry, dict):
+        ip = entry.get("ip")
+        cached_at = entry.get("time")
+        ttl = DNS_CACHE_TTL if ip is not None else DNS_FAILURE_TTL
+        if (
+            isinstance(ip, str | None)
+            and isinstance(cached_at, int | float)
+            and now - cached_at < ttl
+        ):
+            if ip is None:
+                raise socket.gaierror(f"Host name '{host}' recently failed to resolve")
+            return ip
+
+    try:
+        ip = socket.gethostbyname(host)
+    except OSError:
+        entries[host] = {"ip": None, "time": now}
+        raise
+    else:
+        entries[host] = {"ip": ip, "time": now}
+        return ip
+    finally:
+        if cache_file is not None:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps(entries))
+            except OSError as e:
+                logger.warning(f"Failed to cache resolution of '{host}': {e}")
+
+
 def get_local_netid_str() -> str:
     """
     Create the ams netid string value of the Ads client (localhost).
@@ -93,8 +172,9 @@ def process_notifications(
     )
     data = func(notifications)
     logger.debug(
-        f"Applied '{func.__name__}' function "
-        + f"to notification data comprising {len(data[0])} fields"
+        "Applied '%s' function to notification data comprising %d fields",
+        func.__name__,
+        len(data[0]),
     )
     return data
 
@@ -108,11 +188,24 @@ def average(array: np.ndarray) -> np.ndarray:
     :returns: a 1D numpy array with averaged values
     """
     mean_array = np.empty(1, dtype=array.dtype)
-    # TODO: Vectorize - call numpy once to do all the averaging
-    # See https://github.com/DiamondLightSource/fastcs-catio/issues/22
     assert array.dtype.fields is not None
-    for field in array.dtype.fields:
-        mean_array[field] = np.mean(array[field])
+
+    # Group the fields by data type so that each group is averaged by a single call
+    # to numpy on a 2D view of the structured array.
+    # See https://github.com/DiamondLightSource/fastcs-catio/issues/22
+    groups: dict[np.dtype, list[str]] = {}
+    for field, (dtype, *_) in array.dtype.fields.items():
+        groups.setdefault(dtype, []).append(field)
+
+    for dtype, fields in groups.items():
+        if dtype.subdtype is None:
+            means = rfn.structured_to_unstructured(array[fields]).mean(axis=0)
+            for field, mean in zip(fields, means, strict=True):
+                mean_array[field] = mean
+        else:
+            # Array fields (e.g. oversampling terminals) average over all elements
+            for field in fields:
+                mean_array[field] = np.mean(array[field])
     return mean_array
 
 
@@ -136,38 +229,61 @@ def get_notification_changes(
     assert new_array.dtype == old_array.dtype
     assert new_array[0].size == old_array[0].size
 
-    mask = []
-    for a, b in zip(new_array[0], old_array[0], strict=True):
-        mask.append(not np.array_equal(a, b) if isinstance(a, np.ndarray) else a != b)
-
-    diff = []
     assert new_array.dtype.names
-    for val, name in zip(mask, new_array.dtype.names, strict=True):
-        if val:
-            diff.append(name)
+
+    # Compare the first records byte for byte, then map the differing bytes back to
+    # the fields they belong to (padding bytes are ignored).
+    new_bytes = np.ascontiguousarray(new_array[:1]).view(np.uint8)
+    old_bytes = np.ascontiguousarray(old_array[:1]).view(np.uint8)
+    byte_fields = _get_byte_field_indices(new_array.dtype)
+    changed_fields = byte_fields[new_bytes != old_bytes]
+    mask = np.zeros(len(new_array.dtype.names), dtype=bool)
+    mask[changed_fields[changed_fields >= 0]] = True
+
+    diff = [name for val, name in zip(mask, new_array.dtype.names, strict=True) if val]
     return new_array[diff]
 
 
-def filetime_to_dt(filetime: int) -> np.datetime64:
+@lru_cache(maxsize=16)
+def _get_byte_field_indices(dtype: np.dtype) -> npt.NDArray[np.intp]:
+    """
+    Map each byte of a structured data type to the index of the field it belongs to.
+
+    :param dtype: the numpy structured data type
+
+    :returns: an array with the field index of each byte, or -1 for padding bytes
+    """
+    fields = dtype.fields
+    assert fields is not None
+    indices = np.full(dtype.itemsize, -1, dtype=np.intp)
+    for idx, (field_dtype, offset, *_) in enumerate(fields.values()):
+        indices[offset : offset + field_dtype.itemsize] = idx
+    return indices
+
+
+def filetime_to_dt(
+    filetime: int | npt.NDArray[np.integer],
+) -> np.datetime64 | npt.NDArray[np.datetime64]:
     """
-    Convert a Windows FILETIME timestamp to a numpy datetime64 object.
+    Convert Windows FILETIME timestamps to numpy datetime64 objects.
     FILETIME is in 100-nanosecond intervals since January 1, 1601 (UTC).
     Numpy datetime64 is in nanoseconds since January 1, 1970 (UTC).
+    The conversion uses integer arithmetic, so it is exact and vectorised.
 
-    :param filetime: the FILETIME timestamp as a 64-bit integer
+    :param filetime: the FILETIME timestamp as a 64-bit integer, \
+        or an array of such timestamps
 
-    :returns: the corresponding numpy datetime64 object
+    :returns: the corresponding numpy datetime64 object, \
+        or an array of datetime64 objects
     """
     # Difference between epochs in 100-nanosecond intervals
     epoch_diff = 116444736000000000
-    # Number of 100-nanosecond intervals in a second
-    hundred_nanoseconds = 10_000_000
 
-    # Convert FILETIME to seconds since Unix epoch
-    unix_time = (filetime - epoch_diff) / hundred_nanoseconds
+    # Convert FILETIME to nanoseconds since Unix epoch
+    unix_time_ns = (np.asarray(filetime, dtype=np.int64) - epoch_diff) * 100
 
-    # Convert to numpy datetime64 inc. seconds to nanoseconds conversion
-    return np.datetime64(int(unix_time * 1e9), "ns")
+    # Return a numpy datetime64 scalar for a scalar input
+    return unix_time_ns.astype("datetime64[ns]")[()]
 
 
 def trim_ecat_name(name: str) -> str:
@@ -178,7 +294,7 @@ def trim_ecat_name(name: str) -> str:
 
     :returns: a trimmed name without spaces
     """
-    matches = re.search(r"^(\w+\s+)\d+", name)
+    matches = _ECAT_NAME_PREFIX_RE.match(name)
     return matches.group(0).replace(" ", "") if matches else name
 
 
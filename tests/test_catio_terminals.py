@@ -13,6 +13,7 @@ from catio_terminals.models import (
     TerminalConfig,
     TerminalType,
 )
+from catio_terminals.service_file import FileService
 
 
 def test_identity_model():
@@ -158,5 +159,47 @@ def test_composite_type_model():
     assert composite.members[0].name == "Status"
 
 
+def test_file_service_open_file_caches_parsed_yaml(tmp_path: Path):
+    """Test that reopening an unchanged YAML file is served from the JSON cache."""
+    yaml_path = (
+        Path(__file__).parent.parent
+        / "src"
+        / "catio_terminals"
+        / "terminals"
+        / "terminal_types.yaml"
+    )
+    cache_dir = tmp_path / "cache"
+
+    config = FileService.open_file(yaml_path, cache_dir=cache_dir)
+    cache_files = list(cache_dir.glob("*.json"))
+    assert len(cache_files) == 1
+
+    cached_config = FileService.open_file(yaml_path, cache_dir=cache_dir)
+    assert cached_config == config
+    assert cached_config == TerminalConfig.from_yaml(yaml_path)
+
+
+def test_file_service_open_file_invalidates_cache(tmp_path: Path):
+    """Test that the JSON cache is ignored once the YAML file changes."""
+    config = TerminalConfig()
+    config.add_terminal(
+        "EL4004",
+        TerminalType(
+            description="4-channel Analog Output 0..10V 12-bit",
+            identity=Identity(
+                vendor_id=2, product_code=0x0FA43052, revision_number=0x00100000
+            ),
+        ),
+    )
+    yaml_path = tmp_path / "terminals.yaml"
+    cache_dir = tmp_path / "cache"
+    config.to_yaml(yaml_path)
+    assert FileService.open_file(yaml_path, cache_dir=cache_dir) == config
+
+    config.remove_terminal("EL4004")
+    config.to_yaml(yaml_path)
+    assert FileService.open_file(yaml_path, cache_dir=cache_dir) == config
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -6,25 +6,48 @@ Tests currently cover:
 - Data types (AmsNetId, AdsSymbol) -- 'devices.py'
 - Device models (IODevice, IOServer, IOSlave) -- ' _types.py'
 - Connection settings and management -- part of 'catio_connection.py'
+- Attribute value comparison -- part of 'catio_attribute_io.py'
 
 Run the tests with:
 ```bash
 python -m pytest tests/test_catio_units.py -v
 """
 
+import asyncio
+import socket
 from datetime import datetime
 from typing import Literal, get_type_hints
 
 import numpy as np
 import pytest
+from fastcs.attributes import AttrR
+from fastcs.datatypes import Int, Waveform
+from fastcs.util import ONCE
 
 from fastcs_catio._constants import AdsDataType, DeviceType, SymbolFlag
-from fastcs_catio._types import AdsMessageDataType, AmsAddress, AmsNetId
+from fastcs_catio._types import (
+    _DTYPE_TABLE,
+    BYTES6,
+    UINT32,
+    AdsMessageDataType,
+    AmsAddress,
+    AmsNetId,
+    _get_dtype,
+)
+from fastcs_catio.catio_attribute_io import (
+    CATioControllerAttributeIO,
+    CATioControllerAttributeIORef,
+    compare_and_update_attribute_value,
+)
 from fastcs_catio.catio_connection import (
+    CATioConnection,
     CATioFastCSRequest,
     CATioFastCSResponse,
     CATioServerConnectionSettings,
+    CATioStreamConnection,
+    DisconnectedError,
 )
+from fastcs_catio.catio_controller import CATioTerminalController
 from fastcs_catio.devices import (
     AdsSymbol,
     AdsSymbolNode,
@@ -53,6 +76,7 @@ from fastcs_catio.utils import (
     get_localhost_name,
     get_notification_changes,
     process_notifications,
+    resolve_host,
     trim_ecat_name,
 )
 
@@ -96,6 +120,62 @@ class TestLocalHostUtils:
         assert get_local_netid_str() == "10.11.12.13.1.1"
 
 
+class TestResolveHost:
+    """Test suite for resolve_host utility function."""
+
+    def test_ip_address_is_returned_unresolved(self, tmp_path):
+        """An IPv4 address should be returned without any lookup."""
+        cache_file = tmp_path / "dns.json"
+        assert resolve_host("192.0.2.5", cache_file) == "192.0.2.5"
+        assert not cache_file.exists()
+
+    def test_resolution_is_cached(self, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        """A resolved host name should be served from the cache file afterwards."""
+        calls = []
+
+        def fake_gethostbyname(name):
+            calls.append(name)
+            return "192.0.2.7"
+
+        monkeypatch.setattr("socket.gethostbyname", fake_gethostbyname)
+        cache_file = tmp_path / "dns.json"
+        assert resolve_host("twincat-server", cache_file) == "192.0.2.7"
+        assert resolve_host("twincat-server", cache_file) == "192.0.2.7"
+        assert calls == ["twincat-server"]
+
+    def test_failure_is_cached(self, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        """A failed resolution should fail fast on the next attempt."""
+        calls = []
+
+        def fake_gethostbyname(name):
+            calls.append(name)
+            raise socket.gaierror("unknown host")
+
+        monkeypatch.setattr("socket.gethostbyname", fake_gethostbyname)
+        cache_file = tmp_path / "dns.json"
+        for _ in range(2):
+            with pytest.raises(socket.gaierror):
+                resolve_host("unknown-server", cache_file)
+        assert calls == ["unknown-server"]
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "[]",
+            '{"twincat-server": {"ip": "192.0.2.9", "time": "yesterday"}}',
+            '{"twincat-server": {"ip": 42, "time": 1e12}}',
+        ],
+    )
+    def test_malformed_cache_falls_back_to_dns(
+        self, tmp_path, monkeypatch: pytest.MonkeyPatch, content: str
+    ):
+        """A malformed cache file or entry should be ignored, not raise."""
+        monkeypatch.setattr("socket.gethostbyname", lambda name: "192.0.2.7")
+        cache_file = tmp_path / "dns.json"
+        cache_file.write_text(content)
+        assert resolve_host("twincat-server", cache_file) == "192.0.2.7"
+
+
 class TestBytesToString:
     """Test suite for bytes_to_string utility function."""
 
@@ -308,6 +388,23 @@ class TestAverage:
         assert result is not None
         assert result["count"][0] == pytest.approx(20.0)
 
+    def test_average_mixed_fields(self):
+        """Test averaging fields of different types, including array fields."""
+        dtype = np.dtype(
+            [
+                ("a", np.uint16),
+                ("t", np.uint64),
+                ("b", np.uint16),
+                ("samples", np.int32, (2,)),
+            ]
+        )
+        data = np.array([(1, 10, 5, [1, 3]), (3, 30, 7, [5, 7])], dtype=dtype)
+        result = average(data)
+        assert result["a"][0] == 2
+        assert result["t"][0] == 20
+        assert result["b"][0] == 6
+        np.testing.assert_array_equal(result["samples"][0], [4, 4])
+
 
 class TestGetNotificationChanges:
     """Test suite for get_notification_changes utility function."""
@@ -338,6 +435,25 @@ class TestGetNotificationChanges:
         result = get_notification_changes(new, old)
         assert result is not None
 
+    def test_changed_fields_are_returned(self):
+        """Test that only the changed fields, including array fields, are kept."""
+        dtype = np.dtype(
+            {
+                "names": ["a", "b", "samples"],
+                "formats": [np.uint8, np.float64, (np.int16, (3,))],
+                "offsets": [0, 8, 16],
+                "itemsize": 24,
+            }
+        )
+        old = np.zeros(1, dtype=dtype)
+        new = old.copy()
+        new["samples"][0, 1] = 7
+        # Differences in padding bytes must not be reported as changes
+        new.view(np.uint8)[1] = 0xFF
+        result = get_notification_changes(new, old)
+        assert result.dtype.names == ("samples",)
+        np.testing.assert_array_equal(result["samples"][0], [0, 7, 0])
+
 
 class TestTrimEcatName:
     """Test suite for trim_ecat_name utility function."""
@@ -402,6 +518,26 @@ class TestFiletimeToDatetime:
         assert isinstance(result, datetime)
 
 
+class TestFiletimeToDatetime64:
+    """Test suite for filetime_to_dt numpy datetime64 conversion."""
+
+    def test_scalar_filetime(self):
+        """Test that a scalar filetime converts to an exact datetime64."""
+        # FILETIME for 2000-01-01 00:00:00.0000001 UTC
+        result = filetime_to_dt(125911584000000001)
+        assert isinstance(result, np.datetime64)
+        assert result == np.datetime64("2000-01-01T00:00:00.000000100", "ns")
+
+    def test_filetime_array(self):
+        """Test that an array of filetimes converts element-wise."""
+        filetimes = np.array([116444736000000000, 125911584000000000], np.uint64)
+        result = filetime_to_dt(filetimes)
+        np.testing.assert_array_equal(
+            result,
+            np.array(["1970-01-01T00:00:00", "2000-01-01T00:00:00"], "datetime64[ns]"),
+        )
+
+
 class TestCheckNdarray:
     """Test suite for check_ndarray utility function."""
 
@@ -486,6 +622,20 @@ class TestAdsMessageDataType:
             AdsMessageDataType.get_dtype(datatype)
 
 
+class TestAdsMessageDataTypeTable:
+    """Test suite for the predefined AdsMessageDataType alias dtypes."""
+
+    def test_table_matches_introspected_dtypes(self):
+        """Test that each tabulated alias dtype matches the introspected one."""
+        for datatype, dtype in _DTYPE_TABLE.items():
+            assert np.dtype(dtype) == np.dtype(_get_dtype(datatype))
+
+    def test_get_dtype_uses_table(self):
+        """Test that get_dtype resolves the predefined aliases."""
+        assert AdsMessageDataType.get_dtype(UINT32) is np.uint32
+        assert AdsMessageDataType.get_dtype(BYTES6) == "S6"
+
+
 # ===================================================================
 # AmsNetId Tests
 # ===================================================================
@@ -562,6 +712,17 @@ class TestAmsNetId:
         with pytest.raises((AssertionError, ValueError)):
             AmsNetId.from_bytes(b"\x01\x02\x03")  # Too short
 
+    def test_from_bytes_gives_python_ints(self):
+        """Test that the parsed netid octets are plain integers."""
+        netid = AmsNetId.from_bytes(b"\xc0\xa8\x01\x01\x01\x01")
+        assert all(type(part) is int for part in netid.root + netid.mask)
+        assert repr(netid) == "AmsNetId(root=(192, 168, 1, 1), mask=(1, 1))"
+
+    def test_to_bytes_out_of_range_raises(self):
+        """Test that octets outside 0-255 can't be converted to bytes."""
+        with pytest.raises(ValueError):
+            AmsNetId((256, 0, 0, 1), (1, 1)).to_bytes()
+
 
 # ===================================================================
 # AmsAddress Tests
@@ -1153,6 +1314,13 @@ class TestCATioServerConnectionSettings:
         assert "127.0.0.1.1.1" in repr_str
         assert "25565" in repr_str
 
+    def test_settings_are_immutable(self):
+        """Test that connection settings cannot be changed once created."""
+        settings = CATioServerConnectionSettings()
+
+        with pytest.raises(AttributeError):
+            settings.ip = "10.0.0.1"  # type: ignore
+
 
 class TestCATioFastCSRequest:
     """Test suite for CATioFastCSRequest."""
@@ -1209,6 +1377,30 @@ class TestCATioFastCSRequest:
         assert "var1" in repr_str
         assert "key1=10" in repr_str
 
+    def test_request_repr_format(self):
+        """Test the request representation reads as a call of its command."""
+        assert repr(CATioFastCSRequest("read_state")) == "read_state()"
+        assert repr(CATioFastCSRequest("read", 1, key1="a")) == "read(1, key1='a')"
+
+    def test_request_is_immutable_and_hashable(self):
+        """Test that equal requests hash alike and can't be modified."""
+        request = CATioFastCSRequest("read", "var1", key1=10, key2="a")
+        same = CATioFastCSRequest("read", "var1", key2="a", key1=10)
+        assert request == same
+        assert hash(request) == hash(same)
+        with pytest.raises(AttributeError):
+            request.command = "write"  # type: ignore[misc]
+
+    def test_array_valued_request_is_hashable(self):
+        """Test that requests carrying arrays or lists compare and hash by value."""
+        request = CATioFastCSRequest("write", np.arange(4, dtype=np.int16), idx=[1])
+        same = CATioFastCSRequest("write", np.arange(4, dtype=np.int16), idx=[1])
+        other = CATioFastCSRequest("write", np.arange(4, dtype=np.int32), idx=[1])
+        assert request == same
+        assert hash(request) == hash(same)
+        assert request != other
+        assert len({request, same, other}) == 2
+
 
 class TestCATioFastCSResponse:
     """Test suite for CATioFastCSResponse."""
@@ -1253,3 +1445,259 @@ class TestCATioFastCSResponse:
         # Verify string representation
         str_repr = response.to_string()
         assert "status" in str_repr or "ok" in str_repr
+
+
+class _FakeClient:
+    """ADS client stand-in answering VALUE queries after a short delay."""
+
+    async def query(self, message: str, *args, **kwargs):
+        if message != "VALUE":
+            raise ValueError(f"No API method found for query message '{message}'.")
+        await asyncio.sleep(0.01 * (3 - args[0]))
+        return f"{message}:{args[0]}"
+
+
+class _PendingClient:
+    """ADS client stand-in holding queries until released, and recording closure."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.events: list[str] = []
+
+    async def query(self, message: str, *args, **kwargs):
+        await self.release.wait()
+        self.events.append("response")
+        return message
+
+    async def delete_notifications(self, symbols):
+        pass
+
+    async def close(self):
+        self.events.append("close")
+
+
+class TestCATioStreamConnection:
+    """Test suite for CATioStreamConnection."""
+
+    async def test_close_waits_for_pending_query(self):
+        """Test that closing the connection waits for in-flight queries."""
+        client = _PendingClient()
+        connection = CATioStreamConnection(
+            CATioServerConnectionSettings(),
+            client,  # type: ignore
+        )
+        query = asyncio.create_task(connection.query(CATioFastCSRequest("VALUE")))
+        await asyncio.sleep(0)
+        close = asyncio.create_task(connection.close())
+        await asyncio.sleep(0.01)
+        assert not close.done()
+        client.release.set()
+        await asyncio.gather(query, close)
+        assert client.events == ["response", "close"]
+        assert query.result().value == "VALUE"
+
+    async def test_query_without_api_method(self):
+        """Test that a query with no matching API method has a None response."""
+        connection = CATioStreamConnection(
+            CATioServerConnectionSettings(),
+            _FakeClient(),  # type: ignore
+        )
+        response = await connection.query(CATioFastCSRequest("UNKNOWN", 0))
+        assert response.value is None
+
+    async def test_add_notifications_for_unknown_device(self):
+        """Test that subscribing a device without notification symbols fails."""
+        connection = CATioStreamConnection(
+            CATioServerConnectionSettings(),
+            _FakeClient(),  # type: ignore
+        )
+        with pytest.raises(ValueError, match="No notification symbols"):
+            await connection.add_notifications(np.uint16(1))  # type: ignore
+
+
+class TestCATioConnection:
+    """Test suite for CATioConnection."""
+
+    async def test_send_query_routes_to_stream_connection(self):
+        """Test that queries are routed to the bound stream connection."""
+        stream = CATioStreamConnection(
+            CATioServerConnectionSettings(),
+            _FakeClient(),  # type: ignore
+        )
+        connection = CATioConnection(stream)
+        assert await connection.send_query(CATioFastCSRequest("VALUE", 2)) == "VALUE:2"
+
+    async def test_send_query_without_connection(self):
+        """Test that querying before connecting raises a DisconnectedError."""
+        connection = CATioConnection()
+        with pytest.raises(DisconnectedError):
+            await connection.send_query(CATioFastCSRequest("VALUE", 2))
+
+
+# ===================================================================
+# Attribute IO Tests
+# ===================================================================
+
+
+class TestCompareAndUpdateAttributeValue:
+    """Test suite for compare_and_update_attribute_value function."""
+
+    async def test_waveform_updated_when_values_differ(self):
+        """Test that a waveform attribute is updated when its content changes."""
+        attr = AttrR(
+            Waveform(np.int32, shape=(3,)),
+            initial_value=np.zeros(3, dtype=np.int32),
+        )
+        response = np.array([1, 2, 3], dtype=np.int32)
+        await compare_and_update_attribute_value(attr, attr.get(), response)
+        np.testing.assert_array_equal(attr.get(), response)
+
+    async def test_waveform_updated_when_shape_differs(self):
+        """Test that a waveform with a different shape is treated as a change."""
+        attr = AttrR(
+            Waveform(np.int32, shape=(4,)),
+            initial_value=np.zeros(3, dtype=np.int32),
+        )
+        response = np.zeros(4, dtype=np.int32)
+        await compare_and_update_attribute_value(attr, attr.get(), response)
+        assert attr.get().shape == (4,)
+
+    async def test_waveform_unchanged(self):
+        """Test that an identical waveform doesn't update the attribute."""
+        initial = np.array([1, 2, 3], dtype=np.int32)
+        attr = AttrR(Waveform(np.int32, shape=(3,)), initial_value=initial)
+        await compare_and_update_attribute_value(attr, attr.get(), initial.copy())
+        assert attr.get() is initial
+
+    async def test_large_waveform_updated_when_values_differ(self):
+        """Test that a waveform too large for the byte comparison is still compared."""
+        attr = AttrR(
+            Waveform(np.float64, shape=(1000,)),
+            initial_value=np.zeros(1000, dtype=np.float64),
+        )
+        response = np.zeros(1000, dtype=np.float64)
+        response[-1] = 1.0
+        await compare_and_update_attribute_value(attr, attr.get(), response)
+        assert attr.get()[-1] == 1.0
+
+    async def test_scalar_updated_when_value_differs(self):
+        """Test that a scalar attribute is updated with the converted response."""
+        attr = AttrR(Int(), initial_value=1)
+        await compare_and_update_attribute_value(attr, attr.get(), np.uint32(5))
+        assert attr.get() == 5
+
+    async def test_returns_value_to_cache(self):
+        """Test that the value to be cached is returned, changed or not."""
+        attr = AttrR(Int(), initial_value=1)
+        assert await compare_and_update_attribute_value(attr, 1, 5) == 5
+        assert await compare_and_update_attribute_value(attr, 5, 5) == 5
+
+
+class _FakeConnection:
+    """Connection stand-in answering every query with a fixed response."""
+
+    def __init__(self, response):
+        self.response = response
+        self.queries: list[str] = []
+
+    async def send_query(self, message: CATioFastCSRequest):
+        self.queries.append(message.command)
+        return self.response
+
+
+class TestCATioControllerAttributeIO:
+    """Test suite for CATioControllerAttributeIO polling."""
+
+    async def test_first_poll_reads_controller_value(self):
+        """Test that the very first poll already reads the value from the API."""
+        connection = _FakeConnection(np.uint32(7))
+        io = CATioControllerAttributeIO(connection, "device", 1)  # type: ignore
+        attr = AttrR(
+            Int(), io_ref=CATioControllerAttributeIORef("slave_count"), initial_value=0
+        )
+        await io.update(attr)
+        assert connection.queries == ["DEVICE_SLAVECOUNT_ATTR"]
+        assert attr.get() == 7
+
+    async def test_once_attribute_is_not_queried(self):
+        """Test that invariant attributes keep their value without an API query."""
+        connection = _FakeConnection(np.uint32(7))
+        io = CATioControllerAttributeIO(connection, "device", 1)  # type: ignore
+        attr = AttrR(
+            Int(),
+            io_ref=CATioControllerAttributeIORef("slave_count", update_period=ONCE),
+            initial_value=3,
+        )
+        await io.update(attr)
+        assert connection.queries == []
+        assert attr.get() == 3
+
+
+class TestUpdateNparraySubattributes:
+    """Test suite for the polled numpy array sub-attributes of a controller."""
+
+    @staticmethod
+    def _make_controller(connection: _FakeConnection) -> CATioTerminalController:
+        controller = CATioTerminalController("MOD1")
+        controller._tcp_connection = connection  # type: ignore
+        for name in ("StateMachine", "LinkStatus"):
+            controller.add_attribute(name, AttrR(Int(), initial_value=0))
+        return controller
+
+    @staticmethod
+    def _value(controller: CATioTerminalController, name: str):
+        attr = controller.attributes[name]
+        assert isinstance(attr, AttrR)
+        return attr.get()
+
+    async def test_attributes_follow_polled_array(self):
+        """Test that a changed response updates the sub-attribute values."""
+        connection = _FakeConnection(np.array([8, 1], dtype=np.uint8))
+        controller = self._make_controller(connection)
+        await controller.update_nparray_subattributes(
+            ["StateMachine", "LinkStatus"], "TERMINAL_STATES_ATTR", np.uint8
+        )
+        assert connection.queries == ["TERMINAL_STATES_ATTR"]
+        assert self._value(controller, "StateMachine") == 8
+        assert self._value(controller, "LinkStatus") == 1
+
+    async def test_last_values_are_cached(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that the attribute values are only read on the first poll."""
+        connection = _FakeConnection(np.array([8, 1], dtype=np.uint8))
+        controller = self._make_controller(connection)
+        names = ["StateMachine", "LinkStatus"]
+        await controller.update_nparray_subattributes(
+            names, "TERMINAL_STATES_ATTR", np.uint8
+        )
+        monkeypatch.setattr(AttrR, "get", lambda self: pytest.fail("get called"))
+        connection.response = np.array([2, 1], dtype=np.uint8)
+        await controller.update_nparray_subattributes(
+            names, "TERMINAL_STATES_ATTR", np.uint8
+        )
+        monkeypatch.undo()
+        assert self._value(controller, "StateMachine") == 2
+
+    async def test_only_changed_attributes_are_updated(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that unchanged sub-attributes are not pushed again."""
+        connection = _FakeConnection(np.array([8, 1], dtype=np.uint8))
+        controller = self._make_controller(connection)
+        names = ["StateMachine", "LinkStatus"]
+        await controller.update_nparray_subattributes(
+            names, "TERMINAL_STATES_ATTR", np.uint8
+        )
+        updated: list[int] = []
+        original_update = AttrR.update
+
+        async def spy_update(self, value):
+            updated.append(value)
+            await original_update(self, value)
+
+        monkeypatch.setattr(AttrR, "update", spy_update)
+        connection.response = np.array([8, 0], dtype=np.uint8)
+        await controller.update_nparray_subattributes(
+            names, "TERMINAL_STATES_ATTR", np.uint8
+        )
+        assert updated == [0]
+        assert self._value(controller, "LinkStatus") == 0